@@ -0,0 +1,107 @@
+"""
+Cross-rerun caches for the Streamlit pages.
+
+Streamlit re-executes the page script on every interaction. The database
+handle and skill extractor are shared resources, and every query result is
+keyed by JobDatabase.data_version(), so it is only recomputed after an ingest
+actually changes the data. Only aggregates and single pages are cached, never
+the whole table. Results are plain lists and dicts from core.insights and
+JobDatabase; numpy (for the resume ranker) is only imported by the page that uses it.
+"""
+import atexit
+import hashlib
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import streamlit as st
+
+from core import insights
+from core.resume_parser import extract_pdf_text
+from core.skill_extractor import SkillExtractor
+from db.database import JobDatabase
+from db.models import JobFilter
+from utils.metrics import metrics
+
+if TYPE_CHECKING:
+    from core.analyzer import JobRanker
+
+
+@st.cache_resource
+def get_skill_extractor() -> SkillExtractor:
+    return SkillExtractor()
+
+
+@st.cache_resource
+def get_database() -> JobDatabase:
+    return JobDatabase(skill_extractor=get_skill_extractor())
+
+
+@st.cache_resource
+def export_metrics_at_exit() -> bool:
+    """
+    Write the metrics file (JOBVISTA_METRICS_FILE) when the server exits; registered once per process
+    """
+    atexit.register(metrics.export)
+    return True
+
+
+def data_version() -> int:
+    return get_database().data_version()
+
+
+@st.cache_resource(max_entries=2)
+def get_job_ranker(version: int) -> "JobRanker":
+    """
+    Sparse skill index over every live job, rebuilt only when the data version changes
+    """
+    from core.analyzer import JobRanker
+
+    return JobRanker(get_database().iter_job_skills())
+
+
+@st.cache_data(max_entries=16)
+def top_skills(version: int, domain: Optional[str] = None) -> List[Tuple[str, int]]:
+    with metrics.span("dashboard.load", data="top_skills"):
+        return insights.top_skills(get_database(), domain)
+
+
+@st.cache_data(max_entries=64)
+def job_totals(version: int, job_filter: JobFilter) -> Dict[str, int]:
+    return get_database().job_totals(job_filter)
+
+
+@st.cache_data(max_entries=64)
+def city_counts(version: int, job_filter: JobFilter, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    return get_database().city_counts(job_filter, limit)
+
+
+@st.cache_data(max_entries=64)
+def state_counts(version: int, job_filter: JobFilter, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    return get_database().state_counts(job_filter, limit)
+
+
+@st.cache_data(max_entries=64)
+def company_counts(version: int, job_filter: JobFilter, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    return get_database().company_counts(job_filter, limit)
+
+
+@st.cache_data(max_entries=256)
+def job_page(version: int, job_filter: JobFilter, after_id: Optional[int] = None, limit: int = 25) -> List[tuple]:
+    return get_database().job_page(job_filter, after_id, limit)
+
+
+@st.cache_data(max_entries=32)
+def skill_trend(version: int, domain: Optional[str], skills: Tuple[str, ...]) -> insights.Series:
+    with metrics.span("dashboard.load", data="skill_trend"):
+        return insights.skill_trend(get_database(), list(skills), domain)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _resume_text(digest: str, _data: bytes) -> str:
+    return extract_pdf_text(_data)
+
+
+def resume_text(data: bytes) -> str:
+    """
+    Resume text cached by content hash, so reruns (e.g. picking another role) never re-parse the PDF
+    """
+    return _resume_text(hashlib.sha256(data).hexdigest(), data)
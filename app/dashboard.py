@@ -2,15 +2,47 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+import time
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-from db.database import JobDatabase
-from core.skill_extractor import SkillExtractor
-from core.adzuna_scraper import AdzunaScraper
+from dataclasses import replace
+# graph_objects rather than plotly.express: Streamlit already imports it, while
+# plotly.express (with pandas) would add ~0.5s to every cold start
+import plotly.graph_objects as go
+from core.domains import DOMAIN_KEYWORDS
+from app.cache import (
+    export_metrics_at_exit,
+    get_database,
+    data_version,
+    top_skills,
+    skill_trend,
+    job_totals,
+    state_counts,
+    city_counts,
+    company_counts,
+    job_page,
+)
+from db.models import JobFilter
+from utils.helpers import format_range
+from utils.metrics import metrics
+
+render_start = time.perf_counter()
+
+
+def bar_chart(labels, values, colorscale: str) -> go.Figure:
+    """
+    Bars labelled and coloured by their value
+    """
+    values = list(values)
+    return go.Figure(go.Bar(
+        x=list(labels),
+        y=values,
+        text=values,
+        marker=dict(color=values, colorscale=colorscale, showscale=True),
+    ))
 
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(page_title="JobVista India", page_icon="🇮🇳", layout="wide")
+export_metrics_at_exit()
 
 # HIDE DEFAULT PAGE NAV
 st.markdown("""
@@ -178,103 +210,84 @@ st.sidebar.title(" Career Path")
 
 domain_option = st.sidebar.selectbox(
     "Select Job Domain",
-    [
-        "Software Developer",
-        "Data Science",
-        "AI/ML",
-        "Cloud/DevOps",
-        "Frontend",
-        "Backend",
-        "Embedded/Automotive"
-    ]
+    list(DOMAIN_KEYWORDS)
 )
 st.session_state["selected_domain"] = domain_option
 fetch_btn = st.sidebar.button("Refresh Jobs 🔄")
 
 if fetch_btn:
-    keyword_map = {
-        "Software Developer": "software developer",
-        "Data Science": "data science",
-        "AI/ML": "machine learning engineer",
-        "Cloud/DevOps": "cloud engineer",
-        "Frontend": "frontend developer",
-        "Backend": "backend developer",
-        "Embedded/Automotive": "embedded engineer"
-    }
-
-    keyword = keyword_map.get(domain_option, "software developer")
-
-    with st.spinner("Fetching live jobs from Adzuna API..."):
-        scraper = AdzunaScraper()
-        jobs = scraper.fetch_jobs(keyword)
-
-    if jobs:
-        db = JobDatabase()
-        db.clear_jobs()
-        db.insert_jobs(jobs)
-        st.sidebar.success(f"{len(jobs)} jobs fetched successfully!")
+    # The scrapers and the requests stack are only needed here, so only imported here
+    from core.ingest import ingest_domains
+
+    with st.spinner("Fetching live jobs for every domain from all enabled sources..."):
+        result = ingest_domains(get_database())
+    metrics.export()
+
+    fetched = result["inserted"] + result["updated"] + result["unchanged"] + result["duplicates"]
+
+    if fetched:
+        st.sidebar.success(
+            f"{fetched} jobs fetched successfully! "
+            f"({result['inserted']} new, {result['updated']} updated, {result['stale']} closed)"
+        )
         st.rerun()
     else:
         st.sidebar.error("No jobs fetched")
 
 # ---------------- LOAD DATABASE ----------------
-db = JobDatabase()
-rows = db.fetch_all_jobs()
+version = data_version()
+domain_filter = JobFilter(domain=domain_option)
 
-if not rows:
+if job_totals(version, domain_filter)["jobs"] == 0:
     st.warning("⚠ No job data found. Fetch jobs from sidebar.")
     st.stop()
 
-columns = ["id","title","company","location","description","experience","salary","source","apply_link"]
-df = pd.DataFrame(rows, columns=columns)
-df["location"] = df["location"].astype(str).str.split(",").str[0]
-
 # ---------------- SKILL ANALYSIS ----------------
-jobs_list = []
-for _, row in df.iterrows():
-    jobs_list.append(
-        type("Job", (), {
-            "title": row["title"],
-            "company": row["company"],
-            "location": row["location"],
-            "description": row["description"],
-            "experience": row["experience"],
-            "salary": row["salary"],
-            "source": row["source"]
-        })
-    )
-
-skill_engine = SkillExtractor()
-skill_counts = skill_engine.extract_skills_from_jobs(jobs_list)
-
-skill_df = pd.DataFrame(skill_counts.items(), columns=["Skill","Count"])
-skill_df = skill_df.sort_values(by="Count", ascending=False)
+skills = top_skills(version, domain_option)
+skill_names = [skill for skill, _ in skills]
 
 # ---------------- FILTERS ----------------
 st.sidebar.title(" Filter Jobs By ")
 
-locations = sorted(df["location"].dropna().unique().tolist())
+states = sorted(state for state, _ in state_counts(version, domain_filter))
+state_filter = st.sidebar.selectbox("State", ["All"] + states)
+if state_filter != "All":
+    domain_filter = replace(domain_filter, state=state_filter)
+
+locations = sorted(city for city, _ in city_counts(version, domain_filter))
 location_filter = st.sidebar.selectbox("City", ["All"] + locations)
-if location_filter != "All":
-    df = df[df["location"] == location_filter]
 
 skill_filter = st.sidebar.selectbox(
     "Skill",
-    ["All"] + (skill_df["Skill"].tolist() if not skill_df.empty else [])
+    ["All"] + skill_names
+)
+
+search_text = st.sidebar.text_input("Search title / description")
+
+min_salary_lpa = st.sidebar.slider("Minimum salary (LPA)", 0, 50, 0)
+min_years, max_years = st.sidebar.slider("Experience (years)", 0, 30, (0, 30))
+if min_salary_lpa or (min_years, max_years) != (0, 30):
+    st.sidebar.caption("Salary and experience filters skip postings that don't state them.")
+
+job_filter = JobFilter(
+    domain=domain_option,
+    state=None if state_filter == "All" else state_filter,
+    city=None if location_filter == "All" else location_filter,
+    skill=None if skill_filter == "All" else skill_filter,
+    search=search_text.strip() or None,
+    min_salary=min_salary_lpa * 100_000 or None,
+    min_experience=min_years or None,
+    max_experience=max_years if max_years < 30 else None,
 )
-if skill_filter != "All":
-    df = df[df["description"].str.lower().str.contains(skill_filter.lower(), na=False)]
 
 company_filter = st.sidebar.selectbox(
     "Company",
-    ["All"] + sorted(df["company"].dropna().unique().tolist())
+    ["All"] + sorted(company for company, _ in company_counts(version, job_filter))
 )
 if company_filter != "All":
-    df = df[df["company"] == company_filter]
-
-
-
+    job_filter = replace(job_filter, company=company_filter)
 
+totals = job_totals(version, job_filter)
 
 # ===================== DASHBOARD ANALYTICS =====================
 
@@ -286,7 +299,7 @@ col1, col2, col3 = st.columns(3)
 col1.markdown(f"""
 <div style='background:white;padding:28px;border-radius:18px;
 box-shadow:0 10px 25px rgba(0,0,0,0.08);text-align:center'>
-<h1 style='color:#4f46e5;margin:0;font-size:40px'>{len(df)}</h1>
+<h1 style='color:#4f46e5;margin:0;font-size:40px'>{totals['jobs']}</h1>
 <p style='margin:0;color:gray;font-size:16px'>Total Live Jobs</p>
 </div>
 """, unsafe_allow_html=True)
@@ -294,7 +307,7 @@ box-shadow:0 10px 25px rgba(0,0,0,0.08);text-align:center'>
 col2.markdown(f"""
 <div style='background:white;padding:28px;border-radius:18px;
 box-shadow:0 10px 25px rgba(0,0,0,0.08);text-align:center'>
-<h1 style='color:#0ea5e9;margin:0;font-size:40px'>{df['company'].nunique()}</h1>
+<h1 style='color:#0ea5e9;margin:0;font-size:40px'>{totals['companies']}</h1>
 <p style='margin:0;color:gray;font-size:16px'>Companies Hiring</p>
 </div>
 """, unsafe_allow_html=True)
@@ -302,7 +315,7 @@ box-shadow:0 10px 25px rgba(0,0,0,0.08);text-align:center'>
 col3.markdown(f"""
 <div style='background:white;padding:28px;border-radius:18px;
 box-shadow:0 10px 25px rgba(0,0,0,0.08);text-align:center'>
-<h1 style='color:#10b981;margin:0;font-size:40px'>{df['location'].nunique()}</h1>
+<h1 style='color:#10b981;margin:0;font-size:40px'>{totals['cities']}</h1>
 <p style='margin:0;color:gray;font-size:16px'>Active Cities</p>
 </div>
 """, unsafe_allow_html=True)
@@ -312,15 +325,8 @@ st.markdown("<br>", unsafe_allow_html=True)
 # ---------------- SKILL DEMAND CHART ----------------
 st.markdown("###  Most In-Demand Skills in Market")
 
-if not skill_df.empty:
-    fig = px.bar(
-        skill_df.head(10),
-        x="Skill",
-        y="Count",
-        text="Count",
-        color="Count",
-        color_continuous_scale="blues"
-    )
+if skills:
+    fig = bar_chart(*zip(*skills[:10]), colorscale="Blues")
 
     fig.update_layout(
         height=420,
@@ -334,30 +340,58 @@ if not skill_df.empty:
     st.plotly_chart(fig, use_container_width=True)
     st.caption("Insight: These skills are most demanded in current Indian tech job market.")
 
+# ---------------- SKILL DEMAND TREND ----------------
+st.markdown("### 📈 Skill Demand Over Time")
+
+trend_skills = st.multiselect(
+    "Skills to track",
+    skill_names,
+    default=skill_names[:5]
+)
+
+trend_dates, trend_series = skill_trend(version, domain_option, tuple(trend_skills))
+
+if not trend_series:
+    st.info("No history yet for these skills.")
+else:
+    fig_trend = go.Figure([
+        go.Scatter(x=trend_dates, y=jobs, name=skill, mode="lines+markers")
+        for skill, jobs in trend_series.items()
+    ])
+
+    fig_trend.update_layout(
+        height=420,
+        template="ggplot2",
+        xaxis_title="Date",
+        yaxis_title="Live Jobs",
+        title="Live Jobs Asking For Each Skill",
+        title_x=0.3
+    )
+
+    st.plotly_chart(fig_trend, use_container_width=True)
+    st.caption("History grows by one point per day jobs are refreshed.")
+
 # ---------------- TOP CITIES CHART ----------------
 st.markdown("### 📍 Top Hiring Cities in India")
 
-top_locations = df["location"].value_counts().head(10)
+top_locations = city_counts(version, job_filter, 10)
 
-fig_loc = px.bar(
-    x=top_locations.index,
-    y=top_locations.values,
-    text=top_locations.values,
-    color=top_locations.values,
-    color_continuous_scale="teal"
-)
+if top_locations:
+    fig_loc = bar_chart(*zip(*top_locations), colorscale="Teal")
 
-fig_loc.update_layout(
-    height=420,
-    template="ggplot2",
-    xaxis_title="City",
-    yaxis_title="Number of Jobs",
-    title="Cities With Highest Hiring",
-    title_x=0.3
-)
+    fig_loc.update_layout(
+        height=420,
+        template="ggplot2",
+        xaxis_title="City",
+        yaxis_title="Number of Jobs",
+        title="Cities With Highest Hiring",
+        title_x=0.3
+    )
 
-st.plotly_chart(fig_loc, use_container_width=True)
-st.caption("Insight: Focus applying in these cities for higher selection probability.")
+    st.plotly_chart(fig_loc, use_container_width=True)
+    st.caption("Insight: Focus applying in these cities for higher selection probability.")
+else:
+    st.info("No city data for the current filters.")
 
 
 
@@ -365,34 +399,52 @@ st.caption("Insight: Focus applying in these cities for higher selection probabi
 st.subheader(" Latest Jobs")
 
 jobs_per_page = 25
-total_jobs = len(df)
-total_pages = max(1, (total_jobs + jobs_per_page - 1) // jobs_per_page)
+total_pages = max(1, (totals["jobs"] + jobs_per_page - 1) // jobs_per_page)
+
+# Keyset pagination: remember the last id of every page visited, reset when the filters change
+if st.session_state.get("job_filter") != (version, job_filter):
+    st.session_state["job_filter"] = (version, job_filter)
+    st.session_state["job_cursors"] = [None]
+cursors = st.session_state["job_cursors"]
+
+rows = job_page(version, job_filter, cursors[-1], jobs_per_page)
+
+prev_col, info_col, next_col = st.columns([1, 4, 1])
+prev_col.button("⬅ Prev", disabled=len(cursors) == 1, on_click=cursors.pop)
+next_col.button(
+    "Next ➡",
+    disabled=len(cursors) >= total_pages or not rows,
+    on_click=cursors.append,
+    args=(rows[-1][0] if rows else None,),
+)
 
-page = st.number_input("Page", min_value=1, max_value=total_pages, step=1)
-start = (page - 1) * jobs_per_page
-end = start + jobs_per_page
-df_page = df.iloc[start:end]
+info_col.write(f"Showing page {len(cursors)} of {total_pages}")
 
-st.write(f"Showing page {page} of {total_pages}")
+if not rows:
+    st.info("No jobs match the current filters.")
 
-for _, row in df_page.iterrows():
+for _, title, company, city, apply_link, salary_min, salary_max, experience_min, experience_max in rows:
+    salary = format_range(salary_min, salary_max, "LPA", scale=100_000)
+    experience = format_range(experience_min, experience_max, "yrs")
     st.markdown(f"""
     <div class='job-card'>
-    <b>{row['title']}</b><br>
-     {row['company']} &nbsp;&nbsp; 📍 {row['location']}<br><br>
-    <a href="{row['apply_link']}" target="_blank">🚀 Apply Now</a>
+    <b>{title}</b><br>
+     {company} &nbsp;&nbsp; 📍 {city}
+     {f"&nbsp;&nbsp; 💰 {salary}" if salary else ""}
+     {f"&nbsp;&nbsp; 🧳 {experience}" if experience else ""}<br><br>
+    <a href="{apply_link}" target="_blank">🚀 Apply Now</a>
     </div>
     """, unsafe_allow_html=True)
 
 # ---------------- INSIGHT ----------------
 st.subheader(" Hiring Trends & Recommendations")
 
-if not skill_df.empty:
+if skills:
 
-    top_skills = ", ".join(skill_df.head(3)["Skill"].str.upper().tolist())
+    leading_skills = ", ".join(skill.upper() for skill in skill_names[:3])
 
     st.success(
-        f" Based on live job market analysis, companies are actively hiring candidates skilled in {top_skills}. "
+        f" Based on live job market analysis, companies are actively hiring candidates skilled in {leading_skills}. "
         "Upskilling in these areas can significantly improve interview shortlisting chances in India's tech market."
     )
 
@@ -472,3 +524,5 @@ Built for developers to track market demand & get hired faster ⚡
 
 </div>
 """, unsafe_allow_html=True)
+
+metrics.observe("dashboard.render", time.perf_counter() - render_start)
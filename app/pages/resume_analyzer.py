@@ -1,5 +1,11 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
 import streamlit as st
-import pdfplumber
+from app.cache import data_version, get_database, get_job_ranker, get_skill_extractor
+from app.cache import resume_text as extract_resume_text
+from core.resume_parser import ResumeTooLarge
 
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(page_title="Resume Analyzer", page_icon="🚀", layout="wide")
@@ -146,22 +152,14 @@ uploaded_file = st.file_uploader(
     label_visibility="collapsed"
 )
 
-# ---------- PDF TEXT EXTRACT FUNCTION ----------
-def extract_text_from_pdf(file):
-    text = ""
-    with pdfplumber.open(file) as pdf:
-        for page in pdf.pages:
-            content = page.extract_text()
-            if content:
-                text += content.lower() + " "
-    return text
-
-
-
 # ================= MAIN =================
 if uploaded_file:
 
-    resume_text = extract_text_from_pdf(uploaded_file)
+    try:
+        resume_text = extract_resume_text(uploaded_file.getvalue())
+    except ResumeTooLarge as e:
+        st.error(f"Resume is too large to analyze: {e}")
+        st.stop()
 
     if resume_text.strip() == "":
         st.error("Unable to read resume text")
@@ -271,6 +269,41 @@ if uploaded_file:
             </div>
             """, unsafe_allow_html=True)
 
+    # ================= LIVE JOB MATCHES =================
+    st.markdown("## 💼 Best Matching Jobs Right Now")
+
+    resume_skills = get_skill_extractor().extract_skills(resume_text)
+    ranker = get_job_ranker(data_version())
+    top_matches = ranker.rank(resume_skills, k=10)
+
+    if not top_matches:
+        st.info("No stored jobs share skills with your resume yet. Refresh jobs from the dashboard first.")
+    else:
+        st.caption(f"Ranked against {len(ranker)} live postings by skill similarity")
+        jobs_by_id = {
+            row[0]: row for row in get_database().fetch_jobs_by_ids(
+                [m.job_id for m in top_matches], columns=["title", "company", "city", "apply_link"]
+            )
+        }
+
+        for match in top_matches:
+            job = jobs_by_id.get(match.job_id)
+            if job is None:
+                continue
+            _, title, company, location, apply_link = job
+
+            st.markdown(f"""
+            <div style='background:white;padding:14px;border-radius:12px;
+            margin-bottom:10px;border-left:5px solid #06b6d4;
+            box-shadow:0 5px 15px rgba(0,0,0,0.06)'>
+            <b>{title}</b> — {company} • {location}<br>
+            Match <b>{int(match.score * 100)}%</b> •
+            ✔ {", ".join(match.matched) or "—"}
+            {f"• ⭐ Learn: {', '.join(match.missing[:4])}" if match.missing else ""}
+            {f"• <a href='{apply_link}' target='_blank'>Apply</a>" if apply_link else ""}
+            </div>
+            """, unsafe_allow_html=True)
+
     st.markdown("<br>", unsafe_allow_html=True)
 
     st.success("💡 Tip: Update resume after learning new skills and recheck score.")
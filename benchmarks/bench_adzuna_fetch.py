@@ -0,0 +1,108 @@
+"""
+Adzuna pagination against a local stub server: sequential vs concurrent page fetches.
+
+The stub answers every page after a fixed delay, like a remote API's round
+trip, and fails the first request for page 2 with a 503 so the retry path is
+exercised too. Both modes must return the same postings in page order; the
+run stops if they don't.
+
+Run from the project root:
+    python -m benchmarks.bench_adzuna_fetch --pages 5 --latency 0.2
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Every request must reach the stub, never a response cached by an earlier run
+os.environ["JOBVISTA_HTTP_MODE"] = "off"
+
+from core.adzuna_scraper import AdzunaScraper  # noqa: E402
+
+
+def make_handler(pages: int, latency: float, hits: dict):
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"   # keep-alive, like the real API
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            page = int(self.path.split("?")[0].rstrip("/").split("/")[-1])
+            hits[page] = hits.get(page, 0) + 1
+
+            if page == 2 and hits[page] == 1:
+                self._send(503, b"busy")
+                return
+
+            time.sleep(latency)
+            results = [
+                {
+                    "title": f"Engineer {page}-{i}",
+                    "company": {"display_name": f"Company {i % 7}"},
+                    "location": {"display_name": "Bengaluru, Karnataka"},
+                    "description": "python sql docker",
+                    "redirect_url": f"https://example.com/jobs/{page}/{i}",
+                    "salary_min": 800000,
+                    "salary_max": 1200000,
+                }
+                for i in range(AdzunaScraper.RESULTS_PER_PAGE if page <= pages else 0)
+            ]
+            self._send(200, json.dumps({"results": results}).encode("utf-8"))
+
+        def _send(self, status: int, body: bytes):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return StubHandler
+
+
+def timed_fetch(base_url: str, concurrent: bool, max_pages: int):
+    scraper = AdzunaScraper(base_url=base_url, backoff_factor=0.1, max_pages=max_pages)
+    scraper.session.trust_env = False   # no proxy between us and the stub
+    start = time.perf_counter()
+    jobs = scraper.fetch_jobs("python developer", concurrent=concurrent)
+    return time.perf_counter() - start, jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=5, help="pages with results; the next one is empty")
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds the stub takes per page")
+    args = parser.parse_args()
+
+    results = {}
+    for concurrent in (False, True):
+        hits: dict = {}
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.pages, args.latency, hits))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            base_url = f"http://127.0.0.1:{server.server_port}/v1/api/jobs/in/search/{{}}"
+            results[concurrent] = timed_fetch(base_url, concurrent, args.pages + 1) + (hits.get(2, 0),)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    expected = [f"Engineer {page}-{i}" for page in range(1, args.pages + 1)
+                for i in range(AdzunaScraper.RESULTS_PER_PAGE)]
+    for concurrent, (_, jobs, page_2_hits) in results.items():
+        mode = "concurrent" if concurrent else "sequential"
+        if [job.title for job in jobs] != expected:
+            raise SystemExit(f"{mode}: postings missing or out of page order")
+        if page_2_hits != 2:
+            raise SystemExit(f"{mode}: page 2 was requested {page_2_hits} times, expected one retry")
+
+    sequential, concurrent = results[False][0], results[True][0]
+    print(f"{args.pages} pages x {args.latency}s | sequential {sequential:5.2f}s "
+          f"| concurrent {concurrent:5.2f}s | speedup {sequential / concurrent:4.1f}x "
+          f"| {len(expected)} postings in page order, 503 retried")
+
+
+if __name__ == "__main__":
+    main()
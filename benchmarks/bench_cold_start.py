@@ -0,0 +1,94 @@
+"""
+Dashboard cold start: import time of its module graph and time to first paint in a fresh process.
+
+Each measurement runs in a new interpreter against a seeded database in a
+temporary directory. "imports" executes the dashboard's top-level import
+statements; "first paint" is the first full script run under Streamlit's
+AppTest (imports, queries and rendering), "rerun" the next one, as after a
+click. Also lists which heavy libraries the first paint loaded.
+
+Run from the project root:
+    python -m benchmarks.bench_cold_start --size 5000
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.corpus import generate_batch
+from db.database import JobDatabase
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DASHBOARD = os.path.join(ROOT, "app", "dashboard.py")
+HEAVY = ["pandas", "numpy", "plotly.express", "requests", "bs4", "core.sources"]
+
+IMPORTS = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+{imports}
+print(json.dumps({{"seconds": time.perf_counter() - start}}))
+"""
+
+FIRST_PAINT = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+harness = time.perf_counter() - start
+app = AppTest.from_file({dashboard!r}, default_timeout=300)
+start = time.perf_counter()
+app.run()
+first_paint = time.perf_counter() - start
+start = time.perf_counter()
+app.run()
+rerun = time.perf_counter() - start
+print(json.dumps({{"harness": harness, "first_paint": first_paint, "rerun": rerun,
+                  "errors": [e.message for e in app.exception],
+                  "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def dashboard_imports() -> str:
+    """
+    The dashboard's module-level import statements, as source
+    """
+    with open(DASHBOARD, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def run(code: str, cwd: str) -> dict:
+    out = subprocess.run([sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # The dashboard opens jobs.db and reads data/ relative to the working directory
+    with tempfile.TemporaryDirectory() as workdir:
+        os.symlink(os.path.join(ROOT, "data"), os.path.join(workdir, "data"))
+        JobDatabase(os.path.join(workdir, "jobs.db")).upsert_stream([generate_batch(args.size)], stale_domains=[])
+
+        imports = [run(IMPORTS.format(root=ROOT, imports=dashboard_imports()), workdir)["seconds"]
+                   for _ in range(args.repeat)]
+        paints = [run(FIRST_PAINT.format(dashboard=DASHBOARD, heavy=HEAVY), workdir) for _ in range(args.repeat)]
+
+    if paints[0]["errors"]:
+        raise SystemExit(f"dashboard raised: {paints[0]['errors']}")
+
+    print(f"{args.size} jobs, best of {args.repeat} fresh processes")
+    print(f"{'imports':>12} | {min(imports) * 1000:7.0f}ms")
+    for key in ("first_paint", "rerun"):
+        print(f"{key:>12} | {min(p[key] for p in paints) * 1000:7.0f}ms")
+    print(f"{'loaded':>12} | {', '.join(paints[0]['loaded']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Salary and experience parsing: known phrasings, then throughput over the corpus.
+
+Every phrasing in CASES is parsed first and the run stops if any comes back
+different, so a pattern tweak that speeds parsing up by matching less shows
+up here. Then job_terms is timed over generated postings, as ingest calls it
+once per new or edited posting.
+
+Run from the project root:
+    python -m benchmarks.bench_compensation --size 20000
+"""
+import argparse
+import time
+
+from benchmarks.corpus import generate_jobs
+from core.compensation import job_terms, parse_experience, parse_salary
+
+# (parser, text, free_text, expected range)
+CASES = [
+    (parse_salary, "10-15 LPA", False, (1_000_000, 1_500_000)),
+    (parse_salary, "12+ LPA", False, (1_200_000, None)),
+    (parse_salary, "₹12,00,000 - ₹18,00,000 per annum", True, (1_200_000, 1_800_000)),
+    (parse_salary, "₹7,00,000+ per annum", True, (700_000, None)),
+    (parse_salary, "Rs 50k per month", True, (600_000, 600_000)),
+    (parse_salary, "CTC: INR 1200000", True, (1_200_000, 1_200_000)),
+    (parse_salary, "at least ₹8,00,000 CTC", True, (800_000, None)),
+    (parse_salary, "minimum 10 LPA", True, (1_000_000, None)),
+    (parse_salary, "Salary upto 12 lakhs", True, (1_200_000, 1_200_000)),
+    (parse_salary, "15 lakh per annum", True, (1_500_000, 1_500_000)),
+    (parse_salary, "10-15 lakhs", True, (1_000_000, 1_500_000)),
+    (parse_salary, "5 crore users", True, (None, None)),
+    (parse_salary, "2 lakh downloads", True, (None, None)),
+    (parse_salary, "INR 5000000 revenue last year", True, (None, None)),
+    (parse_experience, "3-5 yrs", False, (3, 5)),
+    (parse_experience, "5+ years experience", True, (5, None)),
+    (parse_experience, "Minimum 3 years experience", True, (3, None)),
+    (parse_experience, "at least 5 yrs of experience in java", True, (5, None)),
+    (parse_experience, "freshers welcome", True, (0, 1)),
+    (parse_experience, "20 years in business", True, (None, None)),
+]
+
+
+def check_cases():
+    wrong = []
+    for parser, text, free_text, expected in CASES:
+        got = parser(text, free_text=free_text)
+        if got != expected:
+            wrong.append(f"{parser.__name__}({text!r}, free_text={free_text}) = {got}, expected {expected}")
+    if wrong:
+        raise SystemExit("\n".join(wrong))
+    print(f"{len(CASES)} phrasings parse as expected")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=20_000)
+    args = parser.parse_args()
+
+    check_cases()
+
+    jobs = list(generate_jobs(args.size))
+    start = time.perf_counter()
+    parsed = [job_terms(job.title, job.description, job.experience, job.salary) for job in jobs]
+    elapsed = time.perf_counter() - start
+
+    with_salary = sum(1 for terms in parsed if terms[0] is not None)
+    with_experience = sum(1 for terms in parsed if terms[2] is not None)
+    print(f"{len(jobs):>7} postings | job_terms {elapsed:6.2f}s ({len(jobs) / elapsed:,.0f}/s) "
+          f"| salary {with_salary} | experience {with_experience}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Memory per 100k postings: JobPosting dataclass list vs CompactJobPosting list vs JobBatch.
+
+Every string is built fresh per posting, as json.loads does for API responses,
+so repeated company/location/source values are separate objects until interned.
+
+Run from the project root:
+    python -m benchmarks.bench_job_batch
+"""
+import gc
+import random
+import tracemalloc
+
+from db.models import CompactJobPosting, JobBatch, JobPosting
+
+COUNT = 100_000
+CITIES = ["Bengaluru, Karnataka", "Pune, Maharashtra", "Hyderabad, Telangana", "Chennai, Tamil Nadu", "Noida, Uttar Pradesh"]
+
+
+def raw_records(with_descriptions: bool, seed: int = 7):
+    rng = random.Random(seed)
+    for i in range(COUNT):
+        yield dict(
+            title=f"Software Engineer {i}",
+            company="".join(f"Company {rng.randrange(2000)}"),
+            location="".join(rng.choice(CITIES)),
+            description=(" ".join(["python sql docker kubernetes"] * rng.randrange(10, 40)) + f" {i}"
+                         if with_descriptions else ""),
+            source="".join("AdzunaIndia"),
+            apply_link=f"https://www.adzuna.in/details/{i}",
+        )
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    container = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return current
+
+
+def build_batch(with_descriptions: bool) -> JobBatch:
+    batch = JobBatch()
+    for r in raw_records(with_descriptions):
+        batch.append(**r)
+    return batch
+
+
+def main():
+    for with_descriptions in (True, False):
+        print("with descriptions" if with_descriptions else "metadata only (descriptions empty)")
+
+        cases = {
+            "list[JobPosting]": lambda: [JobPosting(**r) for r in raw_records(with_descriptions)],
+            "list[CompactJobPosting]": lambda: [CompactJobPosting(**r) for r in raw_records(with_descriptions)],
+            "JobBatch": lambda: build_batch(with_descriptions),
+        }
+
+        baseline = None
+        for name, build in cases.items():
+            used = measure(build)
+            baseline = baseline or used
+            print(f"{name:>26}: {used / 1e6:7.1f} MB per {COUNT} postings ({used / baseline:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compare the dashboard's old pandas substring filter with the FTS5 index on 100k rows.
+
+Run from the project root:
+    python -m benchmarks.bench_search
+"""
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.bench_skill_extractor import make_jobs
+from db.database import JobDatabase
+
+QUERIES = ["python", "machine learning", "kubernetes", "c++"]
+ROWS = 100_000
+
+
+def timed(fn, repeat: int = 5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    with open("data/seed_skills.json", "r") as f:
+        skills = json.load(f)
+
+    path = os.path.join(tempfile.mkdtemp(), "bench_jobs.db")
+    db = JobDatabase(path)
+    jobs = make_jobs(skills, ROWS)
+    for i, job in enumerate(jobs):
+        job.apply_link = f"https://example.com/jobs/{i}"
+
+    start = time.perf_counter()
+    db.upsert_jobs(jobs, domain="Bench")
+    print(f"loaded {ROWS} rows (FTS maintained by triggers) in {time.perf_counter() - start:.1f}s")
+
+    descriptions = [job.description for job in jobs]
+
+    try:
+        import pandas as pd
+        frame = pd.DataFrame({"description": descriptions})
+    except ImportError:
+        frame = None
+        print("pandas not installed, comparing against a plain Python scan instead")
+
+    for query in QUERIES:
+        fts_time, ids = timed(lambda: db.search_job_ids(f'"{query}"'))
+
+        if frame is not None:
+            scan_time, _ = timed(
+                lambda: frame[frame["description"].str.lower().str.contains(query, regex=False, na=False)]
+            )
+            label = "pandas str.contains"
+        else:
+            scan_time, _ = timed(lambda: [d for d in descriptions if query in d.lower()])
+            label = "python scan"
+
+        print(f"{query!r:>20} | {label} {scan_time * 1000:8.1f}ms | "
+              f"fts5 {fts_time * 1000:7.1f}ms | {len(ids)} hits")
+
+    top_time, _ = timed(lambda: db.search_jobs("python", limit=25, offset=0))
+    print(f"{'top-25 page':>20} | fts5 search_jobs {top_time * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Compare the compiled skill matcher against the original per-skill substring loop.
+
+Run from the project root:
+    python -m benchmarks.bench_skill_extractor
+"""
+import json
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+from typing import Dict, List
+
+from core.skill_extractor import SkillExtractor
+from db.models import JobPosting
+
+FILLER = (
+    "we are looking for a motivated candidate to join our team and maintain "
+    "scalable services with strong ownership communication and problem solving "
+    "you will collaborate with product and design on customer facing features"
+).split()
+
+
+def legacy_extract(skills: List[str], jobs: List[JobPosting]) -> Dict[str, int]:
+    """
+    The pre-compiled-matcher implementation, kept here as the baseline
+    """
+    skill_counter = Counter()
+
+    for job in jobs:
+        description = job.description.lower()
+
+        for skill in skills:
+            if skill in description:
+                skill_counter[skill] += 1
+
+    return dict(skill_counter)
+
+
+def make_jobs(skills: List[str], count: int, seed: int = 42) -> List[JobPosting]:
+    rng = random.Random(seed)
+    jobs = []
+
+    for i in range(count):
+        words = rng.choices(FILLER, k=120) + rng.sample(skills, k=6)
+        rng.shuffle(words)
+        jobs.append(JobPosting(
+            title=f"Engineer {i}",
+            company=f"Company {i % 500}",
+            location="Bangalore, Karnataka",
+            description=" ".join(words),
+        ))
+
+    return jobs
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    extractor = SkillExtractor()
+
+    with open("data/seed_skills.json", "r") as f:
+        skills = json.load(f)
+
+    for size in (10_000, 100_000):
+        jobs = make_jobs(skills, size)
+
+        legacy = timed(legacy_extract, skills, jobs)
+        compiled = timed(extractor.extract_skills_from_jobs, jobs)
+
+        print(f"{size:>7} jobs, {len(skills):>3} skills | legacy {legacy:7.2f}s "
+              f"| compiled {compiled:7.2f}s | speedup {legacy / compiled:5.1f}x")
+
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    if pd is not None:
+        # The dashboard used to wrap every row in an object just to read .description
+        frame = pd.DataFrame({"description": [job.description for job in make_jobs(skills, 10_000)]})
+
+        def per_row_objects():
+            rows = [type("Job", (), {"description": row["description"]}) for _, row in frame.iterrows()]
+            return extractor.extract_skills_from_jobs(rows)
+
+        per_row = timed(per_row_objects)
+        columnar = timed(extractor.extract_matrix, frame["description"])
+
+        print(f"{len(frame):>7} rows, iterrows + objects {per_row:7.2f}s "
+              f"| extract_matrix {columnar:7.2f}s | speedup {per_row / columnar:5.1f}x")
+
+    # The legacy loop grows with the vocabulary, the compiled matcher does not
+    big_vocab = skills + [f"tool{i}" for i in range(10 * len(skills))]
+
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(big_vocab, f)
+
+    try:
+        big_extractor = SkillExtractor(f.name)
+        jobs = make_jobs(skills, 10_000)
+
+        legacy = timed(legacy_extract, big_vocab, jobs)
+        compiled = timed(big_extractor.extract_skills_from_jobs, jobs)
+
+        print(f"{len(jobs):>7} jobs, {len(big_vocab):>3} skills | legacy {legacy:7.2f}s "
+              f"| compiled {compiled:7.2f}s | speedup {legacy / compiled:5.1f}x")
+    finally:
+        os.unlink(f.name)
+
+
+if __name__ == "__main__":
+    main()
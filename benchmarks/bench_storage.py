@@ -0,0 +1,58 @@
+"""
+Database size with compressed, content-addressed descriptions, and bytes each read path transfers.
+
+Run from the project root:
+    python -m benchmarks.bench_storage --size 20000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.corpus import generate_batch
+from db.database import JobDatabase
+from db.models import JobFilter
+
+
+def payload_bytes(rows) -> int:
+    return sum(len(value) for row in rows for value in row if isinstance(value, (str, bytes)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench_storage.db")
+    db = JobDatabase(path)
+    db.upsert_stream([generate_batch(args.size, args.seed)], stale_domains=[])
+    db.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    report = db.storage_report()
+    raw, stored = report["description_bytes_raw"], report["description_bytes_stored"]
+    inline = report["file_bytes"] + raw - stored
+
+    print(f"{report['jobs']} jobs, {report['descriptions']} distinct descriptions")
+    print(f"descriptions: {raw / 1e6:8.1f} MB raw -> {stored / 1e6:6.1f} MB stored ({raw / max(stored, 1):.1f}x)")
+    print(f"db file:      {inline / 1e6:8.1f} MB inline (est.) -> {report['file_bytes'] / 1e6:6.1f} MB")
+    for key, size in report.items():
+        if key.startswith("table_bytes."):
+            print(f"  {key[len('table_bytes.'):]:>20} {size / 1e6:8.2f} MB")
+
+    domain = db.fetch_all_jobs(columns=["domain"])[0][1]
+    reads = [
+        ("fetch_all_jobs (all columns)", lambda: db.fetch_all_jobs(domain)),
+        ("fetch_all_jobs (no description)", lambda: db.fetch_all_jobs(domain, columns=["title", "company", "city", "apply_link"])),
+        ("job_page", lambda: db.job_page(JobFilter(domain=domain))),
+    ]
+    for label, read in reads:
+        start = time.perf_counter()
+        rows = read()
+        seconds = time.perf_counter() - start
+        print(f"{label:>32} | {len(rows):6} rows | {payload_bytes(rows) / max(len(rows), 1):7.0f} B/row "
+              f"| {seconds * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Trend queries against a year of daily rollups.
+
+Seeds postings_daily and skill_demand_daily with one row per day for every
+domain (and every skill), as a year of daily refreshes would leave them, then
+times the queries behind the dashboard's trend chart.
+
+Run from the project root:
+    python -m benchmarks.bench_trends
+"""
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+from benchmarks.corpus import DOMAINS
+from db.database import JobDatabase
+
+DAYS = 365
+SKILLS = 150
+
+
+def timed(fn, repeat: int = 20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    rng = random.Random(0)
+    db = JobDatabase(os.path.join(tempfile.mkdtemp(), "bench_trends.db"))
+
+    start = date.today() - timedelta(days=DAYS - 1)
+    days = [(start + timedelta(days=i)).isoformat() for i in range(DAYS)]
+    skills = [f"skill{i}" for i in range(SKILLS)]
+
+    with db.manager.write(), db.conn:
+        db.conn.executemany(
+            "INSERT INTO postings_daily (date, domain, live, opened, closed) VALUES (?, ?, ?, ?, ?)",
+            ((day, domain, rng.randrange(1000, 5000), rng.randrange(300), rng.randrange(300))
+             for day in days for domain in DOMAINS),
+        )
+        db.conn.executemany(
+            "INSERT INTO skill_demand_daily (date, domain, skill, count) VALUES (?, ?, ?, ?)",
+            ((day, domain, skill, rng.randrange(1, 500)) for day in days for domain in DOMAINS for skill in skills),
+        )
+    print(f"seeded {DAYS} days x {len(DOMAINS)} domains x {SKILLS} skills "
+          f"= {DAYS * len(DOMAINS) * SKILLS} skill rows")
+
+    since = days[-180]
+    cases = [
+        ("5 skills, one domain, 180d", lambda: db.skill_trend(skills[:5], DOMAINS[0], since)),
+        ("5 skills, all domains, 180d", lambda: db.skill_trend(skills[:5], None, since)),
+        ("1 skill, one domain, 365d", lambda: db.skill_trend(skills[:1], DOMAINS[0])),
+        ("postings, one domain, 365d", lambda: db.postings_trend(DOMAINS[0])),
+    ]
+    for label, query in cases:
+        seconds, rows = timed(query)
+        print(f"{label:>30} | {len(rows):5} rows | {seconds * 1000:6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
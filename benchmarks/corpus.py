@@ -0,0 +1,138 @@
+"""
+Seeded generator of realistic job-posting corpora for benchmarks.
+
+Companies and skills follow Zipf-like popularity, cities follow a weighted
+distribution over Indian tech hubs (including the spelling variants the API
+returns), and description lengths are log-normal around ~250 words with
+3-12 skills mentioned per posting. Most postings ask for an experience range
+and some state a salary, in the description or (as Adzuna does) the salary
+field. The same seed always yields the same corpus.
+"""
+import json
+import math
+import random
+from typing import Iterator, List
+
+from db.models import JobBatch, JobPosting
+
+ROLES = [
+    "Software Developer", "Senior Software Engineer", "Backend Developer", "Frontend Developer",
+    "Full Stack Engineer", "Data Scientist", "Machine Learning Engineer", "Data Analyst",
+    "Cloud Engineer", "DevOps Engineer", "Embedded Software Engineer", "QA Automation Engineer",
+]
+
+CITIES = [
+    ("Bengaluru, Karnataka", 22), ("Bangalore, Karnataka", 8), ("Hyderabad, Telangana", 14),
+    ("Pune, Maharashtra", 12), ("Chennai, Tamil Nadu", 10), ("Gurgaon, Haryana", 7),
+    ("Gurugram, Haryana", 3), ("Noida, Uttar Pradesh", 7), ("Mumbai, Maharashtra", 8),
+    ("Kolkata, West Bengal", 3), ("Ahmedabad, Gujarat", 2), ("Kochi, Kerala", 2), ("India", 2),
+]
+
+DOMAINS = ["Software Developer", "Data Science", "AI/ML", "Cloud/DevOps", "Frontend", "Backend", "Embedded/Automotive"]
+
+SENTENCES = [
+    "We are looking for a motivated engineer to join our growing team.",
+    "You will design, build and maintain scalable services used by millions of customers.",
+    "Collaborate with product managers and designers to ship customer facing features.",
+    "Strong problem solving skills and ownership are expected.",
+    "Experience with agile development and code reviews is a plus.",
+    "You will mentor junior developers and contribute to architecture decisions.",
+    "Excellent communication skills and a bias for action are essential.",
+    "The role offers flexible working hours, health insurance and learning budgets.",
+    "Candidates should be comfortable working in a fast paced startup environment.",
+    "You will own features end to end from design to production monitoring.",
+]
+
+BOILERPLATE = (
+    "We are an equal opportunity employer and value diversity at our company. "
+    "We do not discriminate on the basis of race, religion, colour, national origin, "
+    "gender, sexual orientation, age, marital status or disability status."
+)
+
+
+def _zipf_weights(n: int, exponent: float = 1.1) -> List[float]:
+    return [1.0 / (rank ** exponent) for rank in range(1, n + 1)]
+
+
+def load_skills(skill_file: str = "data/seed_skills.json") -> List[str]:
+    with open(skill_file, "r") as f:
+        return json.load(f)
+
+
+def generate_jobs(size: int, seed: int = 0, skills: List[str] = None) -> Iterator[JobPosting]:
+    """
+    Yield `size` postings; streaming so million-row corpora never sit in memory at once
+    """
+    rng = random.Random(seed)
+    # Salary and experience draw from their own stream so they leave the rest of the corpus unchanged
+    terms = random.Random(f"{seed}-terms")
+    skills = skills or load_skills()
+    skill_weights = _zipf_weights(len(skills))
+    companies = [f"Company {i}" for i in range(max(50, size // 40))]
+    company_weights = _zipf_weights(len(companies))
+    city_names = [c for c, _ in CITIES]
+    city_weights = [w for _, w in CITIES]
+
+    for i in range(size):
+        words = int(min(900, max(40, rng.lognormvariate(math.log(250), 0.5))))
+        picked = set(rng.choices(skills, weights=skill_weights, k=rng.randint(3, 12)))
+
+        parts = []
+        length = 0
+        while length < words:
+            sentence = rng.choice(SENTENCES)
+            parts.append(sentence)
+            length += len(sentence.split())
+        for skill in picked:
+            parts.insert(rng.randrange(len(parts) + 1), f"Hands-on experience with {skill} is required.")
+        if rng.random() < 0.6:
+            parts.append(BOILERPLATE)
+
+        years = terms.choice([0, 1, 2, 3, 5, 8])
+        if terms.random() < 0.7:
+            parts.append(f"We are looking for {years}-{years + terms.choice([2, 3])} years of experience.")
+        lpa = 3 + years * 3 + terms.randrange(6)
+        salary = None
+        if terms.random() < 0.3:
+            salary = f"INR {lpa * 100_000} - {(lpa + terms.randrange(2, 8)) * 100_000}"
+        elif terms.random() < 0.3:
+            parts.append(f"CTC {lpa}-{lpa + terms.randrange(2, 8)} LPA.")
+
+        yield JobPosting(
+            title=rng.choice(ROLES),
+            company=rng.choices(companies, weights=company_weights)[0],
+            location=rng.choices(city_names, weights=city_weights)[0],
+            description=" ".join(parts),
+            salary=salary,
+            source="AdzunaIndia",
+            apply_link=f"https://www.adzuna.in/details/{seed}-{i}",
+            domain=rng.choice(DOMAINS),
+        )
+
+
+def generate_pages(size: int, seed: int = 0, page_size: int = 50) -> Iterator[List[JobPosting]]:
+    """
+    The same corpus cut into API-sized pages, for the streaming ingest path
+    """
+    page: List[JobPosting] = []
+    for job in generate_jobs(size, seed):
+        page.append(job)
+        if len(page) == page_size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+def generate_batch(size: int, seed: int = 0) -> JobBatch:
+    return JobBatch(generate_jobs(size, seed))
+
+
+def generate_resume(seed: int = 0, skill_count: int = 15) -> str:
+    rng = random.Random(seed)
+    skills = rng.sample(load_skills(), k=skill_count)
+    return (
+        "Software engineer with 4 years of experience building web services. "
+        f"Skills: {', '.join(skills)}. "
+        "Projects include a payments platform and an internal analytics dashboard."
+    ).lower()
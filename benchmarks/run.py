@@ -0,0 +1,210 @@
+"""
+Benchmark suite for the ingest and dashboard data paths.
+
+Run from the project root:
+    python -m benchmarks.run --sizes 1000 10000 100000 --output bench.json
+    python -m benchmarks.run --sizes 1000 10000 --compare bench.json
+
+Every case runs against a seeded synthetic corpus (benchmarks.corpus) and the
+results are written as JSON, one record per (case, size), together with the
+commit they were measured on, so runs from different commits can be diffed.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, List
+
+from benchmarks.corpus import generate_batch, generate_resume
+from core.analyzer import JobRanker
+from core.skill_extractor import SkillExtractor
+from db.database import JOB_COLUMNS, JobDatabase
+from db.models import JobFilter
+
+
+def _timed(fn: Callable, repeat: int) -> float:
+    """
+    Best-of-`repeat` wall time, in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _pages(batch, page_size: int = 50):
+    for start in range(0, len(batch), page_size):
+        yield batch[start:start + page_size]
+
+
+class Context:
+    """
+    Per-size state shared between cases: the corpus and a populated database
+    """
+
+    def __init__(self, size: int, seed: int, workdir: str):
+        self.size = size
+        self.seed = seed
+        self.batch = generate_batch(size, seed)
+        self.extractor = SkillExtractor()
+        self.db_path = os.path.join(workdir, f"bench_{size}.db")
+        self.db = None
+
+
+def bench_skill_extraction(ctx: Context, repeat: int) -> float:
+    return _timed(lambda: ctx.extractor.extract_skills_from_jobs(ctx.batch), repeat)
+
+
+def bench_bulk_insert(ctx: Context, repeat: int) -> float:
+    # Always measured once, on an empty database: repeating would only time the unchanged path
+    ctx.db = JobDatabase(ctx.db_path, skill_extractor=ctx.extractor)
+    return _timed(lambda: ctx.db.upsert_stream(_pages(ctx.batch), stale_domains=[]), 1)
+
+
+def bench_reingest_unchanged(ctx: Context, repeat: int) -> float:
+    return _timed(lambda: ctx.db.upsert_stream(_pages(ctx.batch), stale_domains=[]), repeat)
+
+
+def bench_fetch_dataframe(ctx: Context, repeat: int) -> float:
+    import pandas as pd
+
+    def build():
+        rows = ctx.db.fetch_all_jobs()
+        df = pd.DataFrame(rows, columns=["id"] + JOB_COLUMNS)
+        df["location"] = df["location"].astype(str).str.split(",").str[0]
+        return df
+
+    return _timed(build, repeat)
+
+
+def bench_filter_application(ctx: Context, repeat: int) -> float:
+    # One dashboard render: totals, option lists, the city chart and the first page, all in SQLite
+    domain = ctx.batch[0].domain
+    city = ctx.db.city_counts(JobFilter(domain=domain), limit=1)[0][0]
+    job_filter = JobFilter(domain=domain, city=city, skill="python", search="scalable services")
+
+    def apply_filters():
+        ctx.db.job_totals(job_filter)
+        ctx.db.company_counts(job_filter)
+        ctx.db.city_counts(job_filter, limit=10)
+        return ctx.db.job_page(job_filter)
+
+    return _timed(apply_filters, repeat)
+
+
+def bench_range_filter(ctx: Context, repeat: int) -> float:
+    # "at least 15 LPA, 2-4 yrs" within one domain: the totals plus the first page
+    job_filter = JobFilter(domain=ctx.batch[0].domain, min_salary=15 * 100_000, min_experience=2, max_experience=4)
+
+    def apply_filters():
+        ctx.db.job_totals(job_filter)
+        return ctx.db.job_page(job_filter)
+
+    return _timed(apply_filters, repeat)
+
+
+def bench_resume_matching(ctx: Context, repeat: int) -> float:
+    ranker = JobRanker(ctx.db.iter_job_skills())
+    resume = generate_resume(ctx.seed)
+
+    def match():
+        return ranker.rank(ctx.extractor.extract_skills(resume), k=10)
+
+    return _timed(match, repeat)
+
+
+CASES = [
+    ("skill_extraction", bench_skill_extraction),
+    ("bulk_insert", bench_bulk_insert),
+    ("reingest_unchanged", bench_reingest_unchanged),
+    ("fetch_dataframe", bench_fetch_dataframe),
+    ("filter_application", bench_filter_application),
+    ("range_filter", bench_range_filter),
+    ("resume_matching", bench_resume_matching),
+]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(sizes: List[int], seed: int, repeat: int, only: List[str]) -> dict:
+    results = []
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            ctx = Context(size, seed, workdir)
+
+            for name, case in CASES:
+                if only and name not in only and name != "bulk_insert":
+                    continue
+
+                seconds = case(ctx, repeat)
+                results.append({
+                    "case": name,
+                    "size": size,
+                    "seconds": round(seconds, 6),
+                    "rows_per_second": round(size / seconds, 1) if seconds else None,
+                })
+                print(f"{name:>20} {size:>9} rows  {seconds * 1000:10.1f} ms", file=sys.stderr)
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict):
+    previous = {(r["case"], r["size"]): r["seconds"] for r in baseline["results"]}
+
+    print(f"\n{'case':>20} {'size':>9}  {baseline['commit']:>10} -> {current['commit']:<10} change")
+    for r in current["results"]:
+        before = previous.get((r["case"], r["size"]))
+        if before:
+            change = (r["seconds"] - before) / before * 100
+            print(f"{r['case']:>20} {r['size']:>9}  {before * 1000:8.1f}ms -> {r['seconds'] * 1000:8.1f}ms {change:+6.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JobVista benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--case", action="append", default=[], choices=[name for name, _ in CASES],
+                        help="Run only these cases (the database is still built)")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    parser.add_argument("--compare", help="Baseline JSON from an earlier run to diff against")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.seed, args.repeat, args.case)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
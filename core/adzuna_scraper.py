@@ -1,14 +1,24 @@
 import requests
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from typing import List
-from db.models import JobPosting
+from requests.adapters import HTTPAdapter
+from typing import Iterator, List, Optional
+from urllib3.util.retry import Retry
+from core.scraper import BaseScraper
+from db.models import JobBatch, JobPosting
+from utils.http_cache import CachedSession
 from utils.logger import logger
+from utils.metrics import metrics
 
 load_dotenv()  # load .env file
 
 
-class AdzunaScraper:
+class AdzunaScraper(BaseScraper):
+
+    name = "adzuna"
+    timeout = 120.0
+    max_concurrency = 4   # keywords fetched at once, each with up to max_workers pages in flight
 
     APP_ID = os.getenv("ADZUNA_APP_ID")
     APP_KEY = os.getenv("ADZUNA_APP_KEY")
@@ -16,51 +26,177 @@ class AdzunaScraper:
 
     BASE_URL = "https://api.adzuna.com/v1/api/jobs/in/search/{}"
 
-    def fetch_jobs(self, keyword="software developer") -> List[JobPosting]:
+    RESULTS_PER_PAGE = 50
+    MAX_PAGES = 5   # safety limit (~250 jobs)
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_workers: int = 4,
+        request_timeout: float = 10.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        pool_maxsize: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ):
+        """
+        base_url can point at a local stub server; it must contain a {} for the page number.
+        max_workers bounds how many pages are in flight at once per fetch_jobs call;
+        the connection pool defaults to room for max_concurrency such calls sharing this scraper.
+        max_pages overrides the MAX_PAGES safety limit for deep pagination runs.
+        request_timeout bounds each page request; the class-level timeout is the budget for the whole run.
+        """
+        self.base_url = base_url or self.BASE_URL
+        self.max_workers = max(1, max_workers)
+        self.request_timeout = request_timeout
+        self.max_pages = max_pages or self.MAX_PAGES
+        self.session = self._build_session(max_retries, backoff_factor, pool_maxsize or self.max_workers * self.max_concurrency)
+
+    def _build_session(self, max_retries: int, backoff_factor: float, pool_maxsize: int) -> requests.Session:
+        """
+        One keep-alive session shared by every page request, retrying 429/5xx
+        with exponential backoff (honouring Retry-After) and backed by the on-disk HTTP cache
+        """
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+
+        session = CachedSession()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def fetch_jobs(self, keyword="software developer", concurrent=True) -> List[JobPosting]:
         logger.info(f"Fetching INDIA jobs for: {keyword}")
 
         jobs: List[JobPosting] = []
 
-        page = 1
-
-        while True:
-
-            url = f"{self.BASE_URL.format(page)}?app_id={self.APP_ID}&app_key={self.APP_KEY}&results_per_page=50&what={keyword}"
-
-            response = requests.get(url)
+        for results in self._pages(keyword, concurrent):
+            jobs.extend(self._parse_job(job) for job in results)
 
-            if response.status_code != 200:
-                break
-
-            data = response.json()
-            results = data.get("results", [])
-
-            if not results:
-                break
+        logger.info(f"Total jobs fetched: {len(jobs)}")
+        return jobs
 
+    def iter_jobs(self, keyword="software developer", concurrent=True) -> Iterator[JobBatch]:
+        """
+        Streaming form of fetch_jobs: yields the parsed postings one JobBatch page at a time, in page order
+        """
+        for results in self._pages(keyword, concurrent):
+            page = JobBatch()
             for job in results:
+                page.append(**self._job_fields(job))
+            yield page
 
-                title = job.get("title", "")
-                company = job.get("company", {}).get("display_name", "")
-                location = job.get("location", {}).get("display_name", "India")
-                description = job.get("description", "")
-                apply_link = job.get("redirect_url", "")
-
-                job_obj = JobPosting(
-                    title=title,
-                    company=company,
-                    location=location,
-                    description=description,
-                    source="AdzunaIndia",
-                    apply_link=apply_link
-                )
-
-                jobs.append(job_obj)
+    def _pages(self, keyword: str, concurrent: bool) -> Iterator[List[dict]]:
+        return self._iter_pages_concurrently(keyword) if concurrent else self._iter_pages(keyword)
 
-            page += 1
+    def _iter_pages(self, keyword: str) -> Iterator[List[dict]]:
+        """
+        Yield raw results page by page, stopping at the first empty page.
+        A failed page raises, so a cut-short fetch is never mistaken for the end of the results.
+        """
+        for page in range(1, self.max_pages + 1):
+            results = self._fetch_page(keyword, page)
 
-            if page > 5:   # safety limit (~250 jobs)
-                break
+            if not results:
+                return
+
+            yield results
+
+    def _iter_pages_concurrently(self, keyword: str) -> Iterator[List[dict]]:
+        """
+        Same contract as _iter_pages, but keeps up to max_workers pages in flight.
+        Pages are still yielded in order, and nothing past the first empty or failed page is used.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = {}
+            next_page = 1
+
+            while next_page <= min(self.max_workers, self.max_pages):
+                pending[next_page] = pool.submit(self._fetch_page, keyword, next_page)
+                next_page += 1
+
+            try:
+                for page in range(1, self.max_pages + 1):
+                    results = pending.pop(page).result()
+
+                    if not results:
+                        return
+
+                    if next_page <= self.max_pages:
+                        pending[next_page] = pool.submit(self._fetch_page, keyword, next_page)
+                        next_page += 1
+
+                    yield results
+            finally:
+                # Also on a failed page or an abandoned generator: don't fetch pages nobody reads
+                for future in pending.values():
+                    future.cancel()
+
+    def _fetch_page(self, keyword: str, page: int) -> List[dict]:
+        """
+        Results of one page; raises requests.RequestException if the page can't be fetched
+        """
+        params = {
+            "app_id": self.APP_ID,
+            "app_key": self.APP_KEY,
+            "results_per_page": self.RESULTS_PER_PAGE,
+            "what": keyword,
+        }
+
+        with metrics.span("adzuna.fetch_page") as span:
+            try:
+                response = self.session.get(self.base_url.format(page), params=params, timeout=self.request_timeout)
+            except requests.RequestException as e:
+                logger.error(f"Adzuna page {page} failed: {e}")
+                metrics.count("adzuna.pages", outcome="error")
+                raise
 
-        logger.info(f"Total jobs fetched: {len(jobs)}")
-        return jobs
+            if response.status_code != 200:
+                logger.warning(f"Adzuna page {page} returned HTTP {response.status_code}")
+                metrics.count("adzuna.pages", outcome=f"http_{response.status_code}")
+                raise requests.HTTPError(f"Adzuna page {page} returned HTTP {response.status_code}",
+                                         response=response)
+
+            results = response.json().get("results", [])
+            span.items = len(results)
+        metrics.count("adzuna.pages", outcome="ok")
+        return results
+
+    def _parse_job(self, job: dict) -> JobPosting:
+        return JobPosting(**self._job_fields(job))
+
+    def _job_fields(self, job: dict) -> dict:
+        title = job.get("title", "")
+        company = job.get("company", {}).get("display_name", "")
+        location = job.get("location", {}).get("display_name", "India")
+        description = job.get("description", "")
+        apply_link = job.get("redirect_url", "")
+
+        return dict(
+            title=title,
+            company=company,
+            location=location,
+            description=description,
+            salary=self._salary_text(job.get("salary_min"), job.get("salary_max")),
+            source="AdzunaIndia",
+            apply_link=apply_link
+        )
+
+    @staticmethod
+    def _salary_text(salary_min, salary_max) -> Optional[str]:
+        """
+        Adzuna India reports salaries as annual INR numbers; keep them as text like "INR 1200000 - 1800000"
+        """
+        amounts = [f"{float(value):.0f}" for value in (salary_min, salary_max) if value]
+        if not amounts:
+            return None
+        return "INR " + " - ".join(dict.fromkeys(amounts))
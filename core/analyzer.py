@@ -0,0 +1,92 @@
+import heapq
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Set, Tuple
+
+import numpy as np
+
+from utils.logger import logger
+
+
+@dataclass
+class JobMatch:
+    job_id: int
+    score: float
+    matched: List[str]
+    missing: List[str]
+
+
+class JobRanker:
+    """
+    Ranks every stored job against a resume by TF-IDF cosine over skill vectors.
+
+    Built once from the job_skills table: each skill keeps a posting list of the
+    jobs that ask for it, and each job keeps the norm of its weighted skill vector.
+    Scoring a resume then only touches the postings of skills the resume has,
+    instead of walking every job.
+    """
+
+    def __init__(self, job_skills: Iterable[Tuple[int, str]]):
+        postings: Dict[str, List[int]] = {}
+        job_rows: Dict[int, int] = {}
+        job_ids: List[int] = []
+
+        for job_id, skill in job_skills:
+            row = job_rows.get(job_id)
+            if row is None:
+                row = job_rows[job_id] = len(job_ids)
+                job_ids.append(job_id)
+            postings.setdefault(skill, []).append(row)
+
+        job_count = len(job_ids)
+        self.job_ids = np.array(job_ids, dtype=np.int64)
+        self.postings = {skill: np.array(rows, dtype=np.int64) for skill, rows in postings.items()}
+
+        # Smoothed IDF, so a skill in every posting still counts for something
+        self.idf = {skill: math.log((1 + job_count) / (1 + len(rows))) + 1
+                    for skill, rows in self.postings.items()}
+
+        squared = np.zeros(job_count)
+        for skill, rows in self.postings.items():
+            squared[rows] += self.idf[skill] ** 2
+        self.norms = np.sqrt(squared)
+
+        self._job_skills: Dict[int, List[str]] = {}
+        for skill, rows in postings.items():
+            for row in rows:
+                self._job_skills.setdefault(row, []).append(skill)
+
+        logger.info(f"Job ranker built over {job_count} jobs and {len(self.postings)} skills")
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    def rank(self, resume_skills: Set[str], k: int = 10) -> List[JobMatch]:
+        """
+        Top-k jobs by cosine similarity, best first. Jobs sharing no skill with the resume are never scored.
+        """
+        skills = [s for s in {s.lower() for s in resume_skills} if s in self.postings]
+        if not skills or k <= 0:
+            return []
+
+        scores = np.zeros(len(self.job_ids))
+        for skill in skills:
+            scores[self.postings[skill]] += self.idf[skill] ** 2
+
+        resume_norm = math.sqrt(sum(self.idf[s] ** 2 for s in skills))
+        candidates = np.flatnonzero(scores)
+        cosine = scores[candidates] / (self.norms[candidates] * resume_norm)
+
+        top = heapq.nlargest(k, zip(cosine.tolist(), candidates.tolist()))
+
+        wanted = set(skills)
+        matches = []
+        for score, row in top:
+            job_skills = self._job_skills[row]
+            matches.append(JobMatch(
+                job_id=int(self.job_ids[row]),
+                score=score,
+                matched=sorted(s for s in job_skills if s in wanted),
+                missing=sorted(s for s in job_skills if s not in wanted),
+            ))
+        return matches
@@ -0,0 +1,181 @@
+"""
+Numeric salary and experience ranges pulled out of posting text.
+
+Salaries come out as annual INR and experience as years, each as a (min, max)
+pair; either side can be None ("5+ yrs", "minimum 12 LPA" and "at least 3 years"
+have no upper bound). The salary and
+experience fields are read first, then the title and description. All
+patterns are compiled once at import, and texts that can't contain a match
+are skipped with a substring check before any regex runs.
+"""
+import re
+from typing import Optional, Tuple
+
+Range = Tuple[Optional[float], Optional[float]]
+
+_DASH = r"\s*(?:-|–|to)\s*"
+_AMOUNT = r"\d[\d,]*(?:\.\d+)?"
+
+# "12 LPA", "10-15 lakhs", "1.2 cr", "12+ LPA"
+_SALARY_UNITS = re.compile(
+    rf"(?P<lo>{_AMOUNT})(?:{_DASH}(?P<hi>{_AMOUNT}))?\s*(?P<plus>\+)?\s*(?P<unit>lpa|l\.p\.a|lakhs?|lacs?|crores?|cr)\b"
+)
+# "₹12,00,000 - ₹18,00,000", "Rs 50k per month", "INR 1200000", "₹7,00,000+"
+_SALARY_RUPEES = re.compile(
+    rf"(?P<currency>₹|rs\.?|inr)\s*(?P<lo>{_AMOUNT})\s*(?P<lo_k>k\b)?(?P<plus>\s*\+)?"
+    rf"(?:{_DASH}(?:₹|rs\.?|inr)?\s*(?P<hi>{_AMOUNT})\s*(?P<hi_k>k\b)?)?"
+    r"(?P<monthly>\s*(?:per\s+month|/\s*month|/\s*mo\b|p\.?m\b|monthly))?"
+)
+_SALARY_HINTS = ("lpa", "l.p.a", "lakh", "lac", "cr", "₹", "rs", "inr")
+_LAKHS = ("lakh", "lakhs", "lac", "lacs")
+_UNIT_MULTIPLIER = {"lpa": 100_000, "l.p.a": 100_000, "lakh": 100_000, "lakhs": 100_000,
+                    "lac": 100_000, "lacs": 100_000, "crore": 10_000_000, "crores": 10_000_000, "cr": 10_000_000}
+MAX_SALARY = 100_000_000
+_SALARY_BOUNDS = (50_000, MAX_SALARY)   # plausible annual INR; anything else is a misread
+# "5 crore users", "INR 5000000 revenue": outside the salary field, lakh/crore and currency amounts
+# need one of these just before them, or a pay period or CTC just after
+_SALARY_CONTEXT = re.compile(r"(?:salary|ctc|package|pay|compensation|stipend|upto|up to)\W*[^.\n]{0,20}$")
+_SALARY_AFTER = re.compile(r"\W{0,3}(?:per\s+annum|p\.?\s?a\b|/\s*(?:annum|year|yr)\b|per\s+year|annually|ctc\b|salary\b)")
+# "minimum 3 years", "at least 12 LPA": the figure is a floor, with no upper bound
+_AT_LEAST = re.compile(r"\b(?:minimum|min\.?|at\s*least)(?:\s+of)?\W{0,3}$")
+
+
+def _years(group: str) -> str:
+    """
+    "3-5 yrs" / "5+ years" with the bounds captured as <group>_lo, <group>_hi and <group>_plus
+    """
+    number = r"\d{1,2}(?:\.\d)?"
+    return (rf"(?P<{group}_lo>{number})(?:{_DASH}(?P<{group}_hi>{number}))?"
+            rf"\s*(?P<{group}_plus>\+)?\s*(?:yrs?|years?)\b")
+
+
+# In the experience field any "3-5 yrs" counts; in free text it must sit next to "experience"
+_EXPERIENCE_FIELD = re.compile(_years("a"))
+_EXPERIENCE_TEXT = re.compile(
+    rf"(?:experience|exp)\b[^.\n\d]{{0,20}}{_years('a')}"
+    rf"|{_years('b')}(?:\s+of)?(?:\s+\w+){{0,2}}\s+(?:experience|exp)\b"
+)
+_FRESHER = re.compile(r"\bfreshers?\b")
+_YEAR_WORD = re.compile(r"yrs?|years?")
+_MAX_YEARS = 40
+
+
+def _number(text: str) -> float:
+    return float(text.replace(",", ""))
+
+
+def _ordered(lo: Optional[float], hi: Optional[float]) -> Range:
+    if lo is not None and hi is not None and hi < lo:
+        return hi, lo
+    return lo, hi
+
+
+def _is_fresher(text: str) -> bool:
+    return "fresher" in text and _FRESHER.search(text) is not None
+
+
+def _at_least(text: str, start: int) -> bool:
+    return _AT_LEAST.search(text, max(0, start - 20), start) is not None
+
+
+def _floor_or(value: float, match: re.Match, text: str) -> Optional[float]:
+    """
+    Upper bound of a single figure: None if it is a floor ("12+ LPA", "at least ..."), else the figure itself
+    """
+    return None if match["plus"] or _at_least(text, match.start()) else value
+
+
+def _capped(value: Optional[float]) -> Optional[float]:
+    return None if value is None else min(value, _SALARY_BOUNDS[1])
+
+
+def parse_salary(text: Optional[str], free_text: bool = False) -> Range:
+    """
+    (min, max) annual INR mentioned in text, or (None, None). A single figure fills both sides,
+    unless it is a floor ("12+ LPA", "minimum ₹8,00,000"), which leaves max None.
+    With free_text, lakh, crore and currency amounts only count next to a salary word or
+    pay period (LPA and lakh ranges always do), so "INR 5000000 revenue" is not a salary.
+    """
+    if not text:
+        return None, None
+    text = text.lower()
+    if not any(hint in text for hint in _SALARY_HINTS):
+        return None, None
+
+    for match in _SALARY_UNITS.finditer(text):
+        multiplier = _UNIT_MULTIPLIER[match["unit"]]
+        # A range in lakhs ("10-15 lakhs") is a salary on its own; crore ranges and single figures are not
+        if free_text and match["unit"] not in ("lpa", "l.p.a") and \
+                not (match["hi"] and match["unit"] in _LAKHS) and \
+                not _SALARY_AFTER.match(text, match.end()) and \
+                not _SALARY_CONTEXT.search(text, max(0, match.start() - 40), match.start()):
+            continue
+        lo = _number(match["lo"]) * multiplier
+        hi = _number(match["hi"]) * multiplier if match["hi"] else _floor_or(lo, match, text)
+        if _SALARY_BOUNDS[0] <= lo <= _SALARY_BOUNDS[1]:
+            return _ordered(lo, _capped(hi))
+
+    for match in _SALARY_RUPEES.finditer(text):
+        # Word-boundary check done by hand: a leading \b makes this pattern ~5x slower on long descriptions
+        if match["currency"] != "₹" and match.start() and text[match.start() - 1].isalpha():
+            continue
+        if free_text and not match["monthly"] and not _SALARY_AFTER.match(text, match.end()) and \
+                not _SALARY_CONTEXT.search(text, max(0, match.start() - 40), match.start()):
+            continue
+        period = 12 if match["monthly"] else 1
+        lo = _number(match["lo"]) * (1000 if match["lo_k"] else 1) * period
+        hi = _number(match["hi"]) * (1000 if match["hi_k"] else 1) * period if match["hi"] else _floor_or(lo, match, text)
+        if _SALARY_BOUNDS[0] <= lo <= _SALARY_BOUNDS[1]:
+            return _ordered(lo, _capped(hi))
+
+    return None, None
+
+
+def parse_experience(text: Optional[str], free_text: bool = False) -> Range:
+    """
+    (min, max) years of experience asked for, or (None, None); "5+ yrs" and "minimum 5 years" give (5, None).
+    With free_text the years must be tied to the word experience, so "20 years in business" is ignored.
+    """
+    if not text:
+        return None, None
+    text = text.lower()
+    if "yr" not in text and "year" not in text:
+        return (0.0, 1.0) if _is_fresher(text) else (None, None)
+
+    pattern = _EXPERIENCE_TEXT if free_text else _EXPERIENCE_FIELD
+    # Only the text around a "years" can match, so long descriptions are searched in small windows
+    matches = (match for mention in _YEAR_WORD.finditer(text)
+               for match in pattern.finditer(text, max(0, mention.start() - 60), mention.end() + 40))
+    for match in matches:
+        group = "a" if match["a_lo"] else "b"
+        lo = float(match[f"{group}_lo"])
+        if match[f"{group}_hi"]:
+            hi = float(match[f"{group}_hi"])
+        else:
+            hi = None if match[f"{group}_plus"] or _at_least(text, match.start(f"{group}_lo")) else lo
+        if lo <= _MAX_YEARS and (hi is None or hi <= _MAX_YEARS):
+            return _ordered(lo, hi)
+
+    return (0.0, 1.0) if _is_fresher(text) else (None, None)
+
+
+def job_terms(title: str, description: str, experience: Optional[str] = None,
+              salary: Optional[str] = None) -> Tuple[Optional[int], Optional[int], Optional[float], Optional[float]]:
+    """
+    (salary_min, salary_max, experience_min, experience_max) of one posting
+    """
+    salary_range = parse_salary(salary)
+    if salary_range == (None, None):
+        salary_range = parse_salary(title, free_text=True)
+    if salary_range == (None, None):
+        salary_range = parse_salary(description, free_text=True)
+
+    experience_range = parse_experience(experience)
+    if experience_range == (None, None):
+        experience_range = parse_experience(title, free_text=False)
+    if experience_range == (None, None):
+        experience_range = parse_experience(description, free_text=True)
+
+    salary_min, salary_max = (None if value is None else int(value) for value in salary_range)
+    return salary_min, salary_max, experience_range[0], experience_range[1]
+
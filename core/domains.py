@@ -0,0 +1,10 @@
+# Dashboard domain -> search keyword sent to every source
+DOMAIN_KEYWORDS = {
+    "Software Developer": "software developer",
+    "Data Science": "data science",
+    "AI/ML": "machine learning engineer",
+    "Cloud/DevOps": "cloud engineer",
+    "Frontend": "frontend developer",
+    "Backend": "backend developer",
+    "Embedded/Automotive": "embedded engineer"
+}
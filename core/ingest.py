@@ -0,0 +1,42 @@
+from typing import Callable, Dict, Iterable, List, Optional
+from core.domains import DOMAIN_KEYWORDS
+from core.scraper import BaseScraper
+from core.sources import SourceRunner, build_sources
+from db.database import JobDatabase
+from utils.profiling import profile_run
+
+
+def _select_domains(domains: Optional[Iterable[str]]) -> List[str]:
+    wanted = None if domains is None else set(domains)
+    return [d for d in DOMAIN_KEYWORDS if wanted is None or d in wanted]
+
+
+def ingest_domains(
+    db: JobDatabase,
+    domains: Optional[Iterable[str]] = None,
+    sources: Optional[List[BaseScraper]] = None,
+    batch_size: int = 500,
+    on_batch: Optional[Callable[[Dict[str, int]], None]] = None,
+    max_buffered_pages: int = 8,
+) -> Dict[str, object]:
+    """
+    Fetch the given domains (all by default) from every source (the enabled ones by default)
+    concurrently, streaming them into the database in bounded batches.
+    A posting returned for several domains is stored once, under whichever domain stored it first.
+    Domains that any source failed or timed out on are not swept for stale postings.
+    The result adds a per-source latency/yield report under "sources".
+    With JOBVISTA_PROFILE_DIR set, the fetch/store/extract stages are profiled (see utils.profiling).
+    """
+    domains = _select_domains(domains)
+    runner = SourceRunner(build_sources() if sources is None else sources, max_buffered_pages)
+
+    with profile_run():
+        result: Dict[str, object] = dict(db.upsert_stream(
+            runner.stream({d: DOMAIN_KEYWORDS[d] for d in domains}),
+            # Evaluated only once the stream is exhausted, when runner.incomplete is final
+            stale_domains=(d for d in domains if d not in runner.incomplete),
+            batch_size=batch_size,
+            on_batch=on_batch,
+        ))
+    result["sources"] = {name: report.as_dict() for name, report in runner.reports.items()}
+    return result
@@ -0,0 +1,35 @@
+"""
+Dashboard analytics over a JobDatabase, returned as plain lists and dicts.
+
+No Streamlit, pandas or plotting here, so importing it costs next to nothing
+and the results are cheap to cache and to hand to plotly.graph_objects.
+app/cache.py caches each result per data version.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from db.database import JobDatabase
+
+Series = Tuple[List[str], Dict[str, List[int]]]
+
+
+def top_skills(db: JobDatabase, domain: Optional[str] = None) -> List[Tuple[str, int]]:
+    """
+    (skill, live jobs) for every skill in demand, most demanded first
+    """
+    return sorted(db.skill_counts(domain).items(), key=lambda item: (-item[1], item[0]))
+
+
+def skill_trend(db: JobDatabase, skills: List[str], domain: Optional[str] = None,
+                since: Optional[str] = None) -> Series:
+    """
+    (dates, {skill: live jobs on each date}) over every ingest day, 0 on days a skill had no jobs.
+    Skills with no history at all are left out.
+    """
+    rows = db.skill_trend(skills, domain, since)
+    dates = sorted({date for date, _, _ in rows})
+    position = {date: i for i, date in enumerate(dates)}
+
+    series: Dict[str, List[int]] = {}
+    for date, skill, jobs in rows:
+        series.setdefault(skill, [0] * len(dates))[position[date]] += jobs
+    return dates, series
@@ -0,0 +1,108 @@
+"""
+Canonical Indian city and state for a posting's location, from a bundled gazetteer.
+
+Locations arrive as "Bangalore, Karnataka", "Bengaluru Urban", "Gurgaon, Haryana"
+or just "India". Every city and state name and alias is a key of a dict, so a
+location usually resolves with one lookup per comma-separated part; names that
+aren't in the gazetteer fall back to a difflib match, cached per name. Whole
+locations are cached too, since a few hundred strings cover most postings.
+"""
+import json
+import re
+from difflib import get_close_matches
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from utils.logger import logger
+
+Place = Tuple[Optional[str], Optional[str]]
+
+_SEPARATORS = re.compile(r"[,/|;]")
+_NOISE = re.compile(r"[^a-z0-9&]+")
+_COUNTRIES = {"india", "in", "ind", "bharat"}
+
+
+def _key(name: str) -> str:
+    """
+    Lookup key for a place name: lowercase words, punctuation dropped, no trailing "district"
+    """
+    key = " ".join(_NOISE.sub(" ", name.lower()).split())
+    return key[:-len(" district")] if key.endswith(" district") else key
+
+
+class Gazetteer:
+
+    def __init__(self, data_file: str = "data/india_cities.json", fuzzy_cutoff: float = 0.85):
+        with open(data_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        self.cities: Dict[str, Tuple[str, str]] = {}
+        for city in data["cities"]:
+            for name in [city["name"]] + city["aliases"]:
+                self.cities[_key(name)] = (city["name"], city["state"])
+
+        self.states: Dict[str, str] = {}
+        for state in data["states"]:
+            for name in [state["name"], state["code"]] + state["aliases"]:
+                self.states[_key(name)] = state["name"]
+
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self._fuzzy: Dict[str, Optional[Tuple[str, str]]] = {}
+        self._resolved: Dict[str, Place] = {}
+
+        logger.info(f"Gazetteer initialized with {len(data['cities'])} cities")
+
+    def _fuzzy_city(self, key: str) -> Optional[Tuple[str, str]]:
+        """
+        Closest city to a misspelt name ("Banglore", "Hydrabad"), or None; misses are cached too
+        """
+        if len(key) < 4:
+            return None
+        if key not in self._fuzzy:
+            match = get_close_matches(key, self.cities, n=1, cutoff=self.fuzzy_cutoff)
+            self._fuzzy[key] = self.cities[match[0]] if match else None
+        return self._fuzzy[key]
+
+    def _resolve(self, location: str) -> Place:
+        parts: List[Tuple[str, str]] = [(part.strip(), _key(part)) for part in _SEPARATORS.split(location)]
+        parts = [(part, key) for part, key in parts if key]
+
+        state = next((self.states[key] for _, key in parts if key in self.states), None)
+        for _, key in parts:
+            # "Raipur, Haryana" is not the Raipur in the gazetteer
+            if key in self.cities and state in (None, self.cities[key][1]):
+                return self.cities[key]
+
+        unknown = [(part, key) for part, key in parts if key not in self.states and key not in _COUNTRIES]
+        if not unknown:
+            return None, state
+
+        part, key = unknown[0]
+        place = self._fuzzy_city(key)
+        if place is not None and state in (None, place[1]):
+            return place
+        return part, state
+
+    def resolve(self, location: Optional[str]) -> Place:
+        """
+        (city, state) of a location. A city missing from the gazetteer keeps its name as
+        written, with the state if one is named; a bare state or country has no city.
+        """
+        if not location:
+            return None, None
+        place = self._resolved.get(location)
+        if place is None:
+            place = self._resolved[location] = self._resolve(location)
+        return place
+
+
+@lru_cache(maxsize=None)
+def default_gazetteer() -> Gazetteer:
+    return Gazetteer()
+
+
+def resolve_location(location: Optional[str]) -> Place:
+    """
+    (city, state) of a location, against the bundled gazetteer
+    """
+    return default_gazetteer().resolve(location)
@@ -1,25 +1,32 @@
-import requests
 from bs4 import BeautifulSoup
-from typing import List
+from typing import List, Optional
+from urllib.parse import quote_plus
+from core.scraper import BaseScraper
 from db.models import JobPosting
+from utils.http_cache import get_session
 from utils.logger import logger
 
 
-class RemoteOKScraper:
+class RemoteOKScraper(BaseScraper):
     """
     Scrapes real jobs from RemoteOK API page
     """
 
-    URL = "https://remoteok.com/remote-dev+python-jobs"
+    name = "remoteok"
+    enabled = False
+    timeout = 30.0
 
-    def fetch_jobs(self) -> List[JobPosting]:
+    URL = "https://remoteok.com/remote-{}-jobs"
+
+    def fetch_jobs(self, keyword: Optional[str] = None) -> List[JobPosting]:
         logger.info("Fetching REAL jobs from RemoteOK...")
 
         headers = {
             "User-Agent": "Mozilla/5.0"
         }
 
-        response = requests.get(self.URL, headers=headers)
+        url = self.URL.format(quote_plus(keyword or "dev python", safe=""))
+        response = get_session().get(url, headers=headers, timeout=15)
 
         if response.status_code != 200:
             logger.error("Failed to fetch RemoteOK")
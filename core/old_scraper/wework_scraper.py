@@ -1,22 +1,27 @@
-import requests
 from bs4 import BeautifulSoup
-from typing import List
+from typing import List, Optional
+from core.scraper import BaseScraper
 from db.models import JobPosting
+from utils.http_cache import get_session
 from utils.logger import logger
 
 
-class WeWorkScraper:
+class WeWorkScraper(BaseScraper):
     """
     Scrapes real jobs from WeWorkRemotely
     """
 
-    URL = "https://weworkremotely.com/remote-jobs/search?term=python"
+    name = "weworkremotely"
+    enabled = False
+    timeout = 30.0
 
-    def fetch_jobs(self) -> List[JobPosting]:
+    URL = "https://weworkremotely.com/remote-jobs/search"
+
+    def fetch_jobs(self, keyword: Optional[str] = None) -> List[JobPosting]:
         logger.info("Fetching REAL jobs from WeWorkRemotely...")
 
         headers = {"User-Agent": "Mozilla/5.0"}
-        response = requests.get(self.URL, headers=headers)
+        response = get_session().get(self.URL, params={"term": keyword or "python"}, headers=headers, timeout=15)
 
         if response.status_code != 200:
             logger.error("Failed to fetch jobs")
@@ -1,21 +1,26 @@
-import requests
 from bs4 import BeautifulSoup
-from typing import List
+from typing import List, Optional
+from core.scraper import BaseScraper
 from db.models import JobPosting
+from utils.http_cache import get_session
 from utils.logger import logger
 
 
-class StaticJobScraper:
+class StaticJobScraper(BaseScraper):
     """
     Scrapes jobs from a static demo job website
     """
 
+    name = "static_demo"
+    enabled = False   # demo data, useful for exercising the pipeline offline of real APIs
+    timeout = 30.0
+
     URL = "https://realpython.github.io/fake-jobs/"
 
-    def fetch_jobs(self) -> List[JobPosting]:
+    def fetch_jobs(self, keyword: Optional[str] = None) -> List[JobPosting]:
         logger.info("Fetching jobs from static site...")
 
-        response = requests.get(self.URL)
+        response = get_session().get(self.URL, timeout=15)
 
         if response.status_code != 200:
             logger.error("Failed to fetch website")
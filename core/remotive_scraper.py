@@ -1,20 +1,26 @@
-import requests
-from typing import List
+from typing import List, Optional
+from core.scraper import BaseScraper
 from db.models import JobPosting
+from utils.http_cache import get_session
 from utils.logger import logger
 
 
-class RemotiveScraper:
+class RemotiveScraper(BaseScraper):
     """
     Fetch real remote jobs using public API
     """
 
+    name = "remotive"
+    enabled = False   # remote jobs worldwide, not India listings
+    timeout = 30.0
+
     API_URL = "https://remotive.com/api/remote-jobs"
 
-    def fetch_jobs(self) -> List[JobPosting]:
+    def fetch_jobs(self, keyword: Optional[str] = None) -> List[JobPosting]:
         logger.info("Fetching REAL jobs from Remotive API...")
 
-        response = requests.get(self.API_URL)
+        params = {"search": keyword} if keyword else None
+        response = get_session().get(self.API_URL, params=params, timeout=15)
 
         if response.status_code != 200:
             logger.error("Failed to fetch jobs from API")
@@ -0,0 +1,48 @@
+import io
+from typing import List
+from utils.logger import logger
+
+
+MAX_PDF_BYTES = 5 * 1024 * 1024   # uploads beyond this are rejected before parsing
+MAX_PDF_PAGES = 30                # pages past this are ignored
+
+
+class ResumeTooLarge(ValueError):
+    pass
+
+
+def _extract_with_pypdf2(data: bytes, max_pages: int) -> List[str]:
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(io.BytesIO(data))
+    return [page.extract_text() or "" for page in reader.pages[:max_pages]]
+
+
+def _extract_with_pdfplumber(data: bytes, max_pages: int) -> List[str]:
+    """
+    Slow path (~150ms per page); MAX_PDF_PAGES bounds how long it can take
+    """
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages[:max_pages]]
+
+
+def extract_pdf_text(data: bytes, max_pages: int = MAX_PDF_PAGES) -> str:
+    """
+    Lower-cased text of a PDF. Tries the fast PyPDF2 path first and falls back to
+    pdfplumber when it yields nothing (or fails on an unusual layout).
+    """
+    if len(data) > MAX_PDF_BYTES:
+        raise ResumeTooLarge(f"PDF is {len(data) / 1e6:.1f} MB, limit is {MAX_PDF_BYTES / 1e6:.0f} MB")
+
+    try:
+        pages = _extract_with_pypdf2(data, max_pages)
+    except Exception as e:
+        logger.warning(f"PyPDF2 could not read resume, falling back to pdfplumber: {e}")
+        pages = []
+
+    if not any(text.strip() for text in pages):
+        pages = _extract_with_pdfplumber(data, max_pages)
+
+    return " ".join(text.lower() for text in pages if text)
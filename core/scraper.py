@@ -1,13 +1,40 @@
 from abc import ABC, abstractmethod
-from typing import List
-from db.models import JobPosting
+from typing import Dict, Iterator, List, Optional, Type
+from db.models import JobBatch, JobPosting
+
+
+SCRAPERS: Dict[str, Type["BaseScraper"]] = {}
 
 
 class BaseScraper(ABC):
     """
-    Base class for all job scrapers
+    Base class for all job scrapers.
+
+    Subclasses that set `name` register themselves in SCRAPERS. The fan-out
+    runner (core.sources) reads the other class attributes: `enabled` sources run
+    by default, `timeout` is the wall-clock budget in seconds for the whole run of
+    that source, and `max_concurrency` caps how many of its keyword fetches run at once.
     """
 
+    name: Optional[str] = None
+    enabled = True
+    timeout = 60.0
+    max_concurrency = 1
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.name:
+            SCRAPERS[cls.name] = cls
+
     @abstractmethod
-    def fetch_jobs(self) -> List[JobPosting]:
+    def fetch_jobs(self, keyword: Optional[str] = None) -> List[JobPosting]:
         pass
+
+    def iter_jobs(self, keyword: Optional[str] = None) -> Iterator[JobBatch]:
+        """
+        Streaming form of fetch_jobs, as columnar JobBatch pages; paginated scrapers
+        should override it to yield page by page
+        """
+        jobs = self.fetch_jobs(keyword)
+        if jobs:
+            yield JobBatch(jobs)
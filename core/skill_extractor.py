@@ -1,8 +1,9 @@
 import json
-from collections import Counter
-from typing import List, Dict
-from db.models import JobPosting
+import re
+from typing import List, Dict, Set, Union
+from db.models import JobBatch, JobPosting
 from utils.logger import logger
+from utils.metrics import metrics
 
 
 class SkillExtractor:
@@ -11,19 +12,114 @@ class SkillExtractor:
         with open(skill_file, "r") as f:
             self.skills = json.load(f)
 
+        self._pattern = self._compile_pattern(self.skills)
+        self._implied = self._build_implied(self.skills)
+
         logger.info("Skill extractor initialized")
 
-    def extract_skills_from_jobs(self, jobs: List[JobPosting]) -> Dict[str, int]:
+    @staticmethod
+    def _compile_pattern(skills: List[str]):
         """
-        Count skill demand from job descriptions
+        Build one word-boundary regex that finds every skill in a single scan.
+        The alternatives are folded into a prefix trie so the engine never
+        retries skills that share a prefix ("data science", "data analyst").
+        """
+        trie: Dict[str, dict] = {}
+
+        for skill in {s.lower() for s in skills}:
+            node = trie
+            for ch in skill:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+
+        def to_regex(node: Dict[str, dict]) -> str:
+            branches = [re.escape(ch) + to_regex(child)
+                        for ch, child in sorted(node.items()) if ch]
+            if not branches:
+                return ""
+            group = "(?:" + "|".join(branches) + ")"
+            return group + "?" if "" in node else group
+
+        return re.compile(r"(?<![a-z0-9])(" + to_regex(trie) + r")(?![a-z0-9])")
+
+    @staticmethod
+    def _build_implied(skills: List[str]) -> Dict[str, List[str]]:
+        """
+        Map each skill to the shorter skills it contains ("rest api" -> "api").
+        Matches don't overlap, so these are credited alongside the longer one.
+        """
+        lowered = {s.lower() for s in skills}
+        implied: Dict[str, List[str]] = {}
+
+        for skill in lowered:
+            for other in lowered:
+                if other != skill and re.search(
+                        rf"(?<![a-z0-9]){re.escape(other)}(?![a-z0-9])", skill):
+                    implied.setdefault(skill, []).append(other)
+
+        return implied
+
+    def extract_skills(self, text: str) -> Set[str]:
+        """
+        Return the set of skills mentioned in a piece of text
+        """
+        if not text:
+            return set()
+
+        found = {m.group(1) for m in self._pattern.finditer(text.lower())}
+
+        for skill in list(found):
+            found.update(self._implied.get(skill, ()))
+
+        return found
+
+    def extract_matrix(self, descriptions):
+        """
+        Columnar extraction: a boolean job x skill DataFrame aligned with the
+        descriptions (a Series, or any sequence), built without creating an object per row.
+        Counts are matrix.sum(), a skill filter is matrix[skill], per-job lists are skill_lists(matrix).
         """
-        skill_counter = Counter()
+        import numpy as np
+        import pandas as pd
+
+        if not isinstance(descriptions, pd.Series):
+            descriptions = pd.Series(descriptions, dtype=object)
+
+        columns = sorted({s.lower() for s in self.skills})
+        positions = {skill: i for i, skill in enumerate(columns)}
+        matrix = np.zeros((len(descriptions), len(columns)), dtype=bool)
+
+        with metrics.span("skills.extract", mode="matrix") as span:
+            span.items = len(descriptions)
+            found = descriptions.fillna("").astype(str).str.lower().str.findall(self._pattern)
+            found = found.reset_index(drop=True).explode().dropna()
+
+            if not found.empty:
+                codes = found.map(positions).to_numpy()
+                matrix[found.index.to_numpy(), codes] = True
 
-        for job in jobs:
-            description = job.description.lower()
+                for skill, implied in self._implied.items():
+                    for other in implied:
+                        matrix[:, positions[other]] |= matrix[:, positions[skill]]
 
-            for skill in self.skills:
-                if skill in description:
-                    skill_counter[skill] += 1
+        return pd.DataFrame(matrix, index=descriptions.index, columns=columns)
+
+    @staticmethod
+    def skill_lists(matrix) -> List[List[str]]:
+        """
+        Per-job skill lists from an extract_matrix result, in row order
+        """
+        columns = matrix.columns.to_numpy()
+        return [columns[row].tolist() for row in matrix.to_numpy()]
+
+    def extract_skills_from_jobs(self, jobs: Union[List[JobPosting], JobBatch]) -> Dict[str, int]:
+        """
+        Count skill demand from job descriptions
+        """
+        if isinstance(jobs, JobBatch):
+            descriptions = jobs.description
+        else:
+            descriptions = [job.description for job in jobs]
 
-        return dict(skill_counter)
+        counts = self.extract_matrix(descriptions).sum()
+        return {skill: int(count) for skill, count in counts[counts > 0].items()}
@@ -0,0 +1,197 @@
+"""
+Registry of job sources and a fan-out runner that fetches from all of them at once.
+
+Every source is a BaseScraper subclass with a `name`; importing this module
+imports them all so they register. SourceRunner fetches each (source, keyword)
+pair on its own thread and hands pages to one consumer through a bounded queue.
+Each source has its own concurrency limit and wall-clock budget: when a source
+fails or runs out of time, its remaining pages are dropped and the run carries
+on with the others.
+"""
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from core.scraper import SCRAPERS, BaseScraper
+from db.models import JobBatch
+from utils import profiling
+from utils.logger import logger
+
+# Imported for their registration side effect
+import core.adzuna_scraper  # noqa: F401
+import core.old_scraper.remoteok_scraper  # noqa: F401
+import core.old_scraper.wework_scraper  # noqa: F401
+import core.parser  # noqa: F401
+import core.remotive_scraper  # noqa: F401
+
+
+def available_sources() -> List[str]:
+    return sorted(SCRAPERS)
+
+
+def enabled_sources() -> List[str]:
+    return [name for name in available_sources() if SCRAPERS[name].enabled]
+
+
+def build_sources(names: Optional[Iterable[str]] = None) -> List[BaseScraper]:
+    """
+    Instances of the named sources, or of every enabled source by default
+    """
+    names = enabled_sources() if names is None else list(names)
+
+    unknown = [n for n in names if n not in SCRAPERS]
+    if unknown:
+        raise ValueError(f"Unknown job source(s): {', '.join(unknown)}")
+    return [SCRAPERS[name]() for name in names]
+
+
+@dataclass
+class SourceReport:
+    """
+    Latency and yield of one source over a run
+    """
+    name: str
+    tasks: int = 0
+    pages: int = 0
+    jobs: int = 0
+    errors: List[str] = field(default_factory=list)
+    timed_out: bool = False
+    first_page_seconds: Optional[float] = None
+    seconds: float = 0.0
+
+    @property
+    def jobs_per_second(self) -> float:
+        return self.jobs / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "tasks": self.tasks,
+            "pages": self.pages,
+            "jobs": self.jobs,
+            "errors": len(self.errors),
+            "timed_out": self.timed_out,
+            "first_page_seconds": None if self.first_page_seconds is None else round(self.first_page_seconds, 3),
+            "seconds": round(self.seconds, 3),
+            "jobs_per_second": round(self.jobs_per_second, 1),
+        }
+
+
+class SourceRunner:
+    """
+    Fan out keyword searches over several sources and stream the postings back as pages.
+
+    tasks maps each domain to the keyword searched for it (like DOMAIN_KEYWORDS). After
+    stream() is exhausted (or closed), `reports` holds one SourceReport per source
+    and `incomplete` the domains some source failed or timed out on, whose
+    postings therefore can't be treated as a full snapshot.
+    """
+
+    def __init__(self, sources: List[BaseScraper], max_buffered_pages: int = 8):
+        self.sources = sources
+        self.max_buffered_pages = max_buffered_pages
+        self.reports: Dict[str, SourceReport] = {}
+        self.incomplete: Set[str] = set()
+
+    def stream(self, tasks: Dict[str, str]) -> Iterator[JobBatch]:
+        if not self.sources or not tasks:
+            return
+
+        pages: "queue.Queue" = queue.Queue(maxsize=self.max_buffered_pages)
+        stop = threading.Event()
+        start = time.perf_counter()
+
+        self.incomplete = set()
+        self.reports = {s.name: SourceReport(s.name, tasks=len(tasks)) for s in self.sources}
+        # On profiling.clock(), so time spent profiling doesn't count against a source's budget
+        budget_start = profiling.clock()
+        deadlines = {s.name: budget_start + s.timeout for s in self.sources}
+        limits = {s.name: threading.Semaphore(max(1, s.max_concurrency)) for s in self.sources}
+        running = {s.name: set(tasks) for s in self.sources}
+        abandoned = set()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(source: BaseScraper, keyword: str, domain: str):
+            name = source.name
+            try:
+                with limits[name]:
+                    for page in profiling.iterate("fetch", source.iter_jobs(keyword)):
+                        if stop.is_set() or name in abandoned:
+                            return
+                        page.domain[:] = [domain] * len(page)
+                        if not put((name, domain, page)):
+                            return
+                        if profiling.clock() > deadlines[name]:
+                            return   # no end marker: the consumer abandons this source at its deadline
+            except Exception as e:
+                logger.error(f"{name} / {domain}: fetch failed: {e}")
+                put((name, domain, e))
+            else:
+                put((name, domain, None))
+
+        threads = [
+            threading.Thread(target=produce, args=(source, keyword, domain), daemon=True)
+            for source in self.sources
+            for domain, keyword in tasks.items()
+        ]
+        for thread in threads:
+            thread.start()
+
+        def live() -> List[str]:
+            return [name for name in running if running[name] and name not in abandoned]
+
+        def finish(name: str):
+            self.reports[name].seconds = time.perf_counter() - start
+            logger.info(f"{name}: {self.reports[name].jobs} jobs in {self.reports[name].seconds:.1f}s")
+
+        try:
+            while True:
+                now = profiling.clock()
+                for name in live():
+                    if now >= deadlines[name]:
+                        logger.warning(f"{name}: timed out, {len(running[name])} fetches abandoned")
+                        self.reports[name].timed_out = True
+                        self.incomplete.update(running[name])
+                        abandoned.add(name)
+                        finish(name)
+
+                if not live():
+                    return
+
+                # Wake up in time to abandon whichever live source is due next
+                due = min(deadlines[name] for name in live())
+                try:
+                    name, domain, item = pages.get(timeout=max(0.0, due - now))
+                except queue.Empty:
+                    continue
+
+                if name in abandoned:
+                    continue
+
+                report = self.reports[name]
+                if not isinstance(item, JobBatch):
+                    # End of one (source, keyword) fetch, with the error if it failed
+                    if item is not None:
+                        report.errors.append(f"{domain}: {item}")
+                        self.incomplete.add(domain)
+                    running[name].discard(domain)
+                    if not running[name]:
+                        finish(name)
+                    continue
+
+                if report.first_page_seconds is None:
+                    report.first_page_seconds = time.perf_counter() - start
+                report.pages += 1
+                report.jobs += len(item)
+                yield item
+        finally:
+            stop.set()
@@ -0,0 +1,133 @@
+"""
+Process-wide SQLite connections for one database file.
+
+Every JobDatabase on the same file shares one ConnectionManager: a single
+writer connection, serialised by a lock, and a small pool of read-only
+connections. The file is switched to WAL once, so readers keep reading the
+last committed state while a refresh is writing, and schema setup runs once
+per process instead of on every JobDatabase().
+"""
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Set
+
+from utils.logger import logger
+
+
+PRAGMAS = {
+    "synchronous": "NORMAL",      # safe with WAL; fsync at checkpoints, not every commit
+    "busy_timeout": 5000,         # wait for another process's write lock instead of failing
+    "temp_store": "MEMORY",
+    "cache_size": -32000,         # ~32 MB page cache per connection
+}
+
+
+class ConnectionManager:
+    """
+    One writer connection and up to max_readers read-only connections, all usable from any thread.
+    Use write() around every write (it is re-entrant) and reader() for queries.
+    """
+
+    _managers: Dict[str, "ConnectionManager"] = {}
+    _managers_lock = threading.Lock()
+
+    def __init__(self, db_name: str, max_readers: int = 4):
+        self.db_name = db_name
+        self.in_memory = db_name == ":memory:"
+        self.max_readers = max_readers
+
+        self.writer = sqlite3.connect(db_name, check_same_thread=False)
+        self._write_lock = threading.RLock()
+
+        if not self.in_memory:
+            mode = self.writer.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if mode.lower() != "wal":
+                logger.warning(f"{db_name}: could not enable WAL, journal mode is {mode}")
+        self._apply_pragmas(self.writer)
+
+        self._readers: "queue.LifoQueue" = queue.LifoQueue()
+        self._reader_count = 0
+        self._readers_lock = threading.Lock()
+
+        self._done: Set[str] = set()
+        self._once_lock = threading.Lock()
+
+    @classmethod
+    def for_path(cls, db_name: str) -> "ConnectionManager":
+        """
+        The shared manager for a database file (each ":memory:" database gets its own)
+        """
+        if db_name == ":memory:":
+            return cls(db_name)
+
+        key = os.path.abspath(db_name)
+        with cls._managers_lock:
+            if key not in cls._managers:
+                cls._managers[key] = cls(db_name)
+            return cls._managers[key]
+
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection):
+        for name, value in PRAGMAS.items():
+            conn.execute(f"PRAGMA {name}={value}")
+
+    def run_once(self, name: str, setup: Callable[[], None]):
+        """
+        Run setup (e.g. schema creation and migrations) the first time name is seen in this process
+        """
+        with self._once_lock:
+            if name in self._done:
+                return
+            with self.write():
+                setup()
+            self._done.add(name)
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            yield self.writer
+
+    def _open_reader(self) -> sqlite3.Connection:
+        path = os.path.abspath(self.db_name)
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self._apply_pragmas(conn)
+        conn.execute("PRAGMA query_only=1")
+        return conn
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        A pooled read-only connection; blocks when all max_readers are in use.
+        In-memory databases can't be opened twice, so they read through the writer.
+        """
+        if self.in_memory:
+            with self.write() as conn:
+                yield conn
+            return
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._readers_lock:
+                grow = self._reader_count < self.max_readers
+                if grow:
+                    self._reader_count += 1
+            if not grow:
+                conn = self._readers.get()
+            else:
+                try:
+                    conn = self._open_reader()
+                except sqlite3.Error:
+                    with self._readers_lock:
+                        self._reader_count -= 1
+                    raise
+
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._readers.put(conn)
@@ -1,67 +1,1376 @@
+import hashlib
+import re
 import sqlite3
-from typing import List
-from db.models import JobPosting
+import time
+import zlib
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from db.connection import ConnectionManager
+from db.models import JobBatch, JobFilter, JobPosting, JobRow
+from core.compensation import MAX_SALARY, job_terms
+from core.location import resolve_location
+from core.skill_extractor import SkillExtractor
+from utils import profiling
 from utils.logger import logger
+from utils.metrics import metrics
+
+if TYPE_CHECKING:
+    from core.dedup import MinHasher
+
+
+JOB_COLUMNS = ["title", "company", "location", "description", "experience", "salary", "source", "apply_link"]
+
+# jobs keeps a hash in place of the description; the text itself lives zlib-compressed in
+# job_descriptions, stored once per distinct text, and is only read by queries that ask for it.
+# Texts zlib can't shrink are stored as RAW_PREFIX + UTF-8; zlib output never starts with it.
+RAW_PREFIX = b"\x00"
+STORED_COLUMNS = [c if c != "description" else "description_hash" for c in JOB_COLUMNS]
+# Filterable values derived from a posting's text at write time, see _derived_values
+DERIVED_COLUMNS = ["city", "state", "salary_min", "salary_max", "experience_min", "experience_max"]
+# Highest salary a job's range reaches, open ranges ("12+ LPA") counting as MAX_SALARY, so that
+# min_salary is a single indexed range; SQLite computes it, nothing writes it
+SALARY_CEILING = (
+    "INTEGER GENERATED ALWAYS AS "
+    f"(CASE WHEN salary_min IS NULL THEN NULL ELSE COALESCE(salary_max, {MAX_SALARY}) END) VIRTUAL"
+)
+SELECTABLE_COLUMNS = JOB_COLUMNS + DERIVED_COLUMNS + ["domain"]
+
+
+def _normalize_link(link: str) -> str:
+    """
+    Drop tracking parameters so the same posting keeps the same link across fetches
+    """
+    parts = urlsplit(link.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query) if not k.lower().startswith("utm_")]
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+def _identity_hash(title: str, company: str, location: str, apply_link: Optional[str]) -> str:
+    if apply_link:
+        key = "link:" + _normalize_link(apply_link)
+    else:
+        key = "job:" + "|".join((value or "").strip().lower() for value in (title, company, location))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def _fingerprint(values: tuple) -> str:
+    payload = "\x1f".join("" if value is None else str(value) for value in values)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def content_hash(job: JobPosting) -> str:
+    """
+    Stable identity of a posting: its apply link, or title+company+location when it has none
+    """
+    return _identity_hash(job.title, job.company, job.location, job.apply_link)
+
+
+def row_hash(job: JobPosting) -> str:
+    """
+    Fingerprint of every stored field, used to tell changed postings from unchanged ones
+    """
+    return _fingerprint(tuple(getattr(job, c) for c in JOB_COLUMNS))
+
+
+def _fts_query(text: str) -> str:
+    """
+    Turn user input into a safe FTS5 query: "quoted phrases" stay phrases,
+    every other word becomes a quoted term, and all parts must match
+    """
+    parts = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', text):
+        term = (phrase or word).replace('"', " ").strip()
+        if term:
+            parts.append('"' + term + '"')
+    return " ".join(parts)
+
+
+def _derived_values(title: str, location: Optional[str], description: str,
+                    experience: Optional[str], salary: Optional[str]) -> tuple:
+    """
+    DERIVED_COLUMNS values of one posting: its canonical city and state, annual INR salary range
+    and years of experience
+    """
+    return resolve_location(location) + job_terms(title, description, experience, salary)
+
+
+def _derived(job: JobPosting) -> tuple:
+    return _derived_values(job.title, job.location, job.description, job.experience, job.salary)
+
+
+def _filter_sql(job_filter: JobFilter) -> Tuple[str, list]:
+    """
+    WHERE clause and parameters selecting the live jobs a JobFilter matches
+    """
+    clauses, params = ["is_stale = 0"], []
+
+    if job_filter.domain is not None:
+        clauses.append("domain = ?")
+        params.append(job_filter.domain)
+    if job_filter.state is not None:
+        clauses.append("state = ?")
+        params.append(job_filter.state)
+    if job_filter.city is not None:
+        clauses.append("city = ?")
+        params.append(job_filter.city)
+    if job_filter.company is not None:
+        clauses.append("company = ?")
+        params.append(job_filter.company)
+    if job_filter.skill is not None:
+        clauses.append("id IN (SELECT job_id FROM job_skills WHERE skill = ?)")
+        params.append(job_filter.skill.lower())
+    if job_filter.min_salary is not None:
+        clauses.append("salary_ceiling >= ?")
+        params.append(job_filter.min_salary)
+    if job_filter.max_experience is not None:
+        clauses.append("experience_min <= ?")
+        params.append(job_filter.max_experience)
+    if job_filter.min_experience is not None:
+        # No upper bound ("5+ yrs") reaches any minimum
+        clauses.append("experience_min IS NOT NULL AND (experience_max IS NULL OR experience_max >= ?)")
+        params.append(job_filter.min_experience)
+    if job_filter.search:
+        # Input with no searchable term matches nothing, like search_job_ids
+        clauses.append("id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+        params.append(_fts_query(job_filter.search) or '""')
+
+    return " AND ".join(clauses), params
+
+
+def _description_hash(text: Optional[str]) -> Optional[bytes]:
+    if text is None:
+        return None
+    return hashlib.sha1(text.encode("utf-8")).digest()
+
+
+def _stored_values(job: JobPosting) -> tuple:
+    """
+    job's STORED_COLUMNS values: JOB_COLUMNS with the description replaced by its hash
+    """
+    return (job.title, job.company, job.location, _description_hash(job.description),
+            job.experience, job.salary, job.source, job.apply_link)
+
+
+def _deflate(data: bytes) -> bytes:
+    """
+    Stored body of a UTF-8 description: zlib-compressed, or raw when that is no bigger
+    """
+    body = zlib.compress(data)
+    return body if len(body) <= len(data) else RAW_PREFIX + data
+
+
+def _inflate(body: Optional[bytes]) -> Optional[str]:
+    if body is None:
+        return None
+    if body[:1] == RAW_PREFIX:
+        return body[1:].decode("utf-8")
+    return zlib.decompress(body).decode("utf-8")
+
+
+def _select_jobs(columns: Sequence[str]) -> str:
+    """
+    SELECT id plus the given columns FROM jobs, joining job_descriptions only if description is asked for
+    """
+    unknown = [c for c in columns if c not in SELECTABLE_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown job column(s): {', '.join(unknown)}")
+
+    select = ", ".join(["jobs.id"] + ["d.body" if c == "description" else f"jobs.{c}" for c in columns])
+    if "description" in columns:
+        return f"SELECT {select} FROM jobs LEFT JOIN job_descriptions d ON d.hash = jobs.description_hash"
+    return f"SELECT {select} FROM jobs"
+
+
+def _inflate_rows(rows: List[tuple], columns: Sequence[str]) -> List[tuple]:
+    if "description" not in columns:
+        return rows
+    i = list(columns).index("description") + 1
+    return [row[:i] + (_inflate(row[i]),) + row[i + 1:] for row in rows]
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
 
 
 class JobDatabase:
 
-    def __init__(self, db_name: str = "jobs.db"):
-        self.conn = sqlite3.connect(db_name)
-        self.create_table()
+    def __init__(
+        self,
+        db_name: str = "jobs.db",
+        skill_extractor: Optional[SkillExtractor] = None,
+        minhasher: Optional["MinHasher"] = None,
+    ):
+        """
+        Instances on the same file share its ConnectionManager, so they are cheap to create,
+        safe to use from any thread, and only the first one in a process sets up the schema.
+        Writes go through the single writer connection (self.conn); queries use pooled readers.
+        """
+        self.manager = ConnectionManager.for_path(db_name)
+        self.conn = self.manager.writer
+        self._skill_extractor = skill_extractor
+        self._minhasher = minhasher
+        self.manager.run_once("schema", self.create_table)
+
+    @property
+    def skill_extractor(self) -> SkillExtractor:
+        if self._skill_extractor is None:
+            self._skill_extractor = SkillExtractor()
+        return self._skill_extractor
+
+    @property
+    def minhasher(self) -> "MinHasher":
+        # Only writes need it, so read-only users (the dashboard) never import numpy
+        if self._minhasher is None:
+            from core.dedup import MinHasher
+            self._minhasher = MinHasher()
+        return self._minhasher
 
     def create_table(self):
-        query = """
+        with self.manager.write():
+            self._create_tables()
+
+    def _create_tables(self):
+        query = f"""
         CREATE TABLE IF NOT EXISTS jobs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT,
             company TEXT,
             location TEXT,
-            description TEXT,
+            description_hash BLOB,
             experience TEXT,
             salary TEXT,
             source TEXT,
-            apply_link TEXT
+            apply_link TEXT,
+            content_hash TEXT,
+            row_hash TEXT,
+            domain TEXT,
+            is_stale INTEGER NOT NULL DEFAULT 0,
+            first_seen TEXT,
+            updated_at TEXT,
+            last_seen TEXT,
+            city TEXT,
+            state TEXT,
+            salary_min INTEGER,
+            salary_max INTEGER,
+            experience_min REAL,
+            experience_max REAL,
+            salary_ceiling {SALARY_CEILING}
         )
         """
         self.conn.execute(query)
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS job_descriptions (
+            hash BLOB PRIMARY KEY,
+            size INTEGER NOT NULL,
+            body BLOB NOT NULL
+        )
+        """)
+        moved = self._migrate_jobs_table()
+        self.conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_content_hash ON jobs(content_hash)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_domain ON jobs(domain, is_stale)")
+        # Dashboard filters and counts: (domain, is_stale, city, company) covers totals and both counts,
+        # and id rides along in every index, so filtered pages come back in id order
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_city ON jobs(domain, is_stale, city, company)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(domain, is_stale, company)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs(domain, is_stale, state, city)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_description ON jobs(description_hash)")
+        # Range filters: salary_ceiling >= ? and experience_min <= ? are index range scans within a domain
+        self.conn.execute("DROP INDEX IF EXISTS idx_jobs_salary")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_salary_ceiling ON jobs(domain, is_stale, salary_ceiling)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_experience ON jobs(domain, is_stale, experience_min)")
+        self._create_search_index()
+        self._create_skill_index()
+        self._create_rollups()
+        self._create_dedup_index()
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
         self.conn.commit()
+
+        if moved:
+            # Give the pages freed by the old inline descriptions back to the filesystem
+            self.conn.execute("VACUUM")
         logger.info("Database table ensured")
 
-    def insert_jobs(self, jobs: List[JobPosting]):
-        query = """
-        INSERT INTO jobs (title, company, location, description, experience, salary, source, apply_link)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        job_data = [
-            (
-                job.title,
-                job.company,
-                job.location,
-                job.description,
-                job.experience,
-                job.salary,
-                job.source,
-                job.apply_link
+    def _migrate_jobs_table(self) -> bool:
+        """
+        Bring a jobs table created before upserts (or before description storage) existed up to date.
+        Returns whether inline descriptions were moved out of jobs.
+        """
+        # table_xinfo: unlike table_info it lists generated columns
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_xinfo(jobs)")}
+        added_columns = {
+            "content_hash": "TEXT",
+            "row_hash": "TEXT",
+            "domain": "TEXT",
+            "is_stale": "INTEGER NOT NULL DEFAULT 0",
+            "first_seen": "TEXT",
+            "updated_at": "TEXT",
+            "last_seen": "TEXT",
+            "city": "TEXT",
+            "state": "TEXT",
+            "description_hash": "BLOB",
+            "salary_min": "INTEGER",
+            "salary_max": "INTEGER",
+            "experience_min": "REAL",
+            "experience_max": "REAL",
+            "salary_ceiling": SALARY_CEILING,
+        }
+
+        for name, definition in added_columns.items():
+            if name not in existing:
+                self.conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {definition}")
+
+        if "content_hash" not in existing:
+            self._backfill_hashes()
+
+        moved = "description" in existing
+        if moved:
+            self._move_descriptions()
+
+        if any(name not in existing for name in DERIVED_COLUMNS):
+            self._backfill_derived()
+        return moved
+
+    def _backfill_derived(self):
+        columns = ["title", "location", "description", "experience", "salary"]
+        rows = _inflate_rows(self.conn.execute(_select_jobs(columns)).fetchall(), columns)
+        self.conn.executemany(
+            f"UPDATE jobs SET {', '.join(f'{c} = ?' for c in DERIVED_COLUMNS)} WHERE id = ?",
+            (_derived_values(*row[1:]) + (row[0],) for row in rows),
+        )
+        logger.info(f"Backfilled {', '.join(DERIVED_COLUMNS)} for {len(rows)} jobs")
+
+    def _backfill_hashes(self):
+        legacy = self.conn.execute(
+            f"SELECT id, {', '.join(JOB_COLUMNS)} FROM jobs WHERE content_hash IS NULL ORDER BY id"
+        ).fetchall()
+
+        if not legacy:
+            return
+
+        seen = {row[0] for row in self.conn.execute("SELECT content_hash FROM jobs WHERE content_hash IS NOT NULL")}
+        updates, duplicates = [], []
+
+        for row in legacy:
+            job = JobPosting(*row[1:])
+            key = content_hash(job)
+            if key in seen:
+                duplicates.append((row[0],))
+            else:
+                seen.add(key)
+                updates.append((key, row_hash(job), row[0]))
+
+        self.conn.executemany("UPDATE jobs SET content_hash = ?, row_hash = ? WHERE id = ?", updates)
+        self.conn.executemany("DELETE FROM jobs WHERE id = ?", duplicates)
+        logger.info(f"Backfilled {len(updates)} job hashes, dropped {len(duplicates)} duplicates")
+
+    def _move_descriptions(self):
+        """
+        Move inline jobs.description text into job_descriptions and drop the column,
+        together with the external-content search index that read it
+        """
+        rows = self.conn.execute("SELECT id, description FROM jobs").fetchall()
+        hashes = self._store_descriptions(description for _, description in rows)
+        self.conn.executemany(
+            "UPDATE jobs SET description_hash = ? WHERE id = ?",
+            ((key, job_id) for key, (job_id, _) in zip(hashes, rows)),
+        )
+
+        self.conn.executescript("""
+        DROP TRIGGER IF EXISTS jobs_fts_insert;
+        DROP TRIGGER IF EXISTS jobs_fts_delete;
+        DROP TRIGGER IF EXISTS jobs_fts_update;
+        DROP TABLE IF EXISTS jobs_fts;
+        ALTER TABLE jobs DROP COLUMN description;
+        """)
+        logger.info(f"Moved {len(rows)} descriptions into job_descriptions")
+
+    def _create_search_index(self):
+        """
+        Contentless FTS5 index over title and description. Descriptions are stored compressed,
+        so SQLite can't read them back for an external-content index: writes keep it in sync
+        through _index_text/_unindex_text instead of triggers.
+        """
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+        ).fetchone()
+
+        self.conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            title, description,
+            content='',
+            tokenize="unicode61 tokenchars '+#'"
+        )
+        """)
+
+        if not exists:
+            rows = self.conn.execute(_select_jobs(["title", "description"])).fetchall()
+            self._index_text({row[0]: row[1:] for row in _inflate_rows(rows, ["title", "description"])})
+            logger.info(f"Full-text search index built for {len(rows)} jobs")
+
+    def _create_skill_index(self):
+        """
+        job -> skill inverted index filled at ingest time, with per-skill totals
+        kept up to date by triggers instead of recounting the corpus
+        """
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_skills'"
+        ).fetchone()
+
+        self.conn.executescript("""
+        CREATE TABLE IF NOT EXISTS job_skills (
+            job_id INTEGER NOT NULL,
+            skill TEXT NOT NULL,
+            PRIMARY KEY (job_id, skill)
+        );
+        CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills(skill, job_id);
+
+        CREATE TABLE IF NOT EXISTS skill_counts (
+            skill TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        );
+
+        CREATE TRIGGER IF NOT EXISTS job_skills_count_insert AFTER INSERT ON job_skills BEGIN
+            INSERT INTO skill_counts(skill, count) VALUES (new.skill, 1)
+            ON CONFLICT(skill) DO UPDATE SET count = count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS job_skills_count_delete AFTER DELETE ON job_skills BEGIN
+            UPDATE skill_counts SET count = count - 1 WHERE skill = old.skill;
+        END;
+
+        -- BEFORE, so triggers on job_skills can still look up the job's domain
+        DROP TRIGGER IF EXISTS jobs_skills_delete;
+        CREATE TRIGGER IF NOT EXISTS jobs_skills_cascade BEFORE DELETE ON jobs BEGIN
+            DELETE FROM job_skills WHERE job_id = old.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS jobs_skills_stale AFTER UPDATE OF is_stale ON jobs
+        WHEN new.is_stale = 1 BEGIN
+            DELETE FROM job_skills WHERE job_id = new.id;
+        END;
+        """)
+
+        if not exists:
+            live = self.conn.execute(_select_jobs(["description"]) + " WHERE is_stale = 0").fetchall()
+            self._index_skills(dict(_inflate_rows(live, ["description"])))
+            logger.info(f"Skill index built for {len(live)} jobs")
+
+    def _create_rollups(self):
+        """
+        Daily history that survives jobs being closed or cleared: live postings per domain and
+        live jobs per (domain, skill). Triggers apply every change to today's rows as it happens;
+        _carry_forward_rollups starts a new day from the last one, so nothing is ever recounted.
+        Days without an ingest have no rows.
+        """
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'postings_daily'"
+        ).fetchone()
+
+        self.conn.executescript("""
+        CREATE TABLE IF NOT EXISTS postings_daily (
+            date TEXT NOT NULL,
+            domain TEXT NOT NULL,
+            live INTEGER NOT NULL DEFAULT 0,
+            opened INTEGER NOT NULL DEFAULT 0,
+            closed INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (domain, date)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_postings_daily_date ON postings_daily(date);
+
+        CREATE TABLE IF NOT EXISTS skill_demand_daily (
+            date TEXT NOT NULL,
+            domain TEXT NOT NULL,
+            skill TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (domain, skill, date)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_skill_demand_daily_date ON skill_demand_daily(date);
+        -- Covers trends summed over every domain
+        CREATE INDEX IF NOT EXISTS idx_skill_demand_daily_skill ON skill_demand_daily(skill, date, count);
+
+        CREATE TRIGGER IF NOT EXISTS jobs_daily_insert AFTER INSERT ON jobs
+        WHEN new.is_stale = 0 BEGIN
+            INSERT INTO postings_daily (date, domain, live, opened) VALUES (date('now'), COALESCE(new.domain, ''), 1, 1)
+            ON CONFLICT(domain, date) DO UPDATE SET live = live + 1, opened = opened + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS jobs_daily_reopen AFTER UPDATE OF is_stale ON jobs
+        WHEN old.is_stale = 1 AND new.is_stale = 0 BEGIN
+            INSERT INTO postings_daily (date, domain, live, opened) VALUES (date('now'), COALESCE(new.domain, ''), 1, 1)
+            ON CONFLICT(domain, date) DO UPDATE SET live = live + 1, opened = opened + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS jobs_daily_close AFTER UPDATE OF is_stale ON jobs
+        WHEN old.is_stale = 0 AND new.is_stale = 1 BEGIN
+            INSERT INTO postings_daily (date, domain, live, closed) VALUES (date('now'), COALESCE(old.domain, ''), -1, 1)
+            ON CONFLICT(domain, date) DO UPDATE SET live = live - 1, closed = closed + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS jobs_daily_delete AFTER DELETE ON jobs
+        WHEN old.is_stale = 0 BEGIN
+            INSERT INTO postings_daily (date, domain, live, closed) VALUES (date('now'), COALESCE(old.domain, ''), -1, 1)
+            ON CONFLICT(domain, date) DO UPDATE SET live = live - 1, closed = closed + 1;
+        END;
+
+        -- A live job given a domain (legacy rows have none) moves its posting and skills along with it
+        CREATE TRIGGER IF NOT EXISTS jobs_daily_domain AFTER UPDATE OF domain ON jobs
+        WHEN old.is_stale = 0 AND new.is_stale = 0 AND old.domain IS NOT new.domain BEGIN
+            INSERT INTO postings_daily (date, domain, live) VALUES (date('now'), COALESCE(old.domain, ''), -1)
+            ON CONFLICT(domain, date) DO UPDATE SET live = live - 1;
+            INSERT INTO postings_daily (date, domain, live) VALUES (date('now'), COALESCE(new.domain, ''), 1)
+            ON CONFLICT(domain, date) DO UPDATE SET live = live + 1;
+            INSERT INTO skill_demand_daily (date, domain, skill, count)
+            SELECT date('now'), COALESCE(old.domain, ''), skill, -1 FROM job_skills WHERE job_id = new.id
+            ON CONFLICT(domain, skill, date) DO UPDATE SET count = count - 1;
+            INSERT INTO skill_demand_daily (date, domain, skill, count)
+            SELECT date('now'), COALESCE(new.domain, ''), skill, 1 FROM job_skills WHERE job_id = new.id
+            ON CONFLICT(domain, skill, date) DO UPDATE SET count = count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS job_skills_daily_insert AFTER INSERT ON job_skills BEGIN
+            INSERT INTO skill_demand_daily (date, domain, skill, count)
+            SELECT date('now'), COALESCE(domain, ''), new.skill, 1 FROM jobs WHERE id = new.job_id
+            ON CONFLICT(domain, skill, date) DO UPDATE SET count = count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS job_skills_daily_delete AFTER DELETE ON job_skills BEGIN
+            INSERT INTO skill_demand_daily (date, domain, skill, count)
+            SELECT date('now'), COALESCE(domain, ''), old.skill, -1 FROM jobs WHERE id = old.job_id
+            ON CONFLICT(domain, skill, date) DO UPDATE SET count = count - 1;
+        END;
+        """)
+
+        if not exists:
+            self.conn.execute(
+                """
+                INSERT INTO postings_daily (date, domain, live)
+                SELECT date('now'), COALESCE(domain, ''), COUNT(*) FROM jobs WHERE is_stale = 0 GROUP BY 2
+                """
+            )
+            self.conn.execute(
+                """
+                INSERT INTO skill_demand_daily (date, domain, skill, count)
+                SELECT date('now'), COALESCE(jobs.domain, ''), js.skill, COUNT(*) FROM job_skills js
+                JOIN jobs ON jobs.id = js.job_id
+                GROUP BY 2, 3
+                """
             )
-            for job in jobs
-        ]
+            logger.info("Daily rollups seeded from the current jobs")
 
-        self.conn.executemany(query, job_data)
-        self.conn.commit()
-        logger.info(f"{len(jobs)} jobs inserted into database")
+    def _carry_forward_rollups(self):
+        """
+        Start today's rollup rows from the latest earlier day, once per day; callers own the transaction
+        """
+        self.conn.execute(
+            """
+            INSERT INTO postings_daily (date, domain, live)
+            SELECT date('now'), domain, live FROM postings_daily
+            WHERE date = (SELECT MAX(date) FROM postings_daily) AND date < date('now')
+            """
+        )
+        self.conn.execute(
+            """
+            INSERT INTO skill_demand_daily (date, domain, skill, count)
+            SELECT date('now'), domain, skill, count FROM skill_demand_daily
+            WHERE date = (SELECT MAX(date) FROM skill_demand_daily) AND date < date('now') AND count > 0
+            """
+        )
+
+    def _create_dedup_index(self):
+        """
+        MinHash signatures and LSH buckets of every stored posting, plus job_sources:
+        one row per (source posting -> canonical job), so a posting collapsed into
+        another one still records where it was seen
+        """
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_signatures'"
+        ).fetchone()
+
+        self.conn.executescript("""
+        CREATE TABLE IF NOT EXISTS job_signatures (
+            job_id INTEGER PRIMARY KEY,
+            company_key TEXT NOT NULL,
+            signature BLOB NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS lsh_buckets (
+            band INTEGER NOT NULL,
+            bucket INTEGER NOT NULL,
+            job_id INTEGER NOT NULL,
+            PRIMARY KEY (band, bucket, job_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_lsh_buckets_job ON lsh_buckets(job_id);
+
+        CREATE TABLE IF NOT EXISTS job_sources (
+            content_hash TEXT PRIMARY KEY,
+            job_id INTEGER NOT NULL,
+            source TEXT,
+            apply_link TEXT,
+            first_seen TEXT,
+            last_seen TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_job_sources_job ON job_sources(job_id);
+
+        CREATE TRIGGER IF NOT EXISTS jobs_dedup_delete AFTER DELETE ON jobs BEGIN
+            DELETE FROM job_signatures WHERE job_id = old.id;
+            DELETE FROM lsh_buckets WHERE job_id = old.id;
+            DELETE FROM job_sources WHERE job_id = old.id;
+        END;
+        """)
+
+        if not exists:
+            rows = self.conn.execute(
+                _select_jobs(["title", "company", "description"])
+            ).fetchall()
+            self._index_signatures({row[0]: row[1:] for row in _inflate_rows(rows, ["title", "company", "description"])})
+            self.conn.execute(
+                """
+                INSERT OR IGNORE INTO job_sources
+                SELECT content_hash, id, source, apply_link, first_seen, first_seen FROM jobs
+                """
+            )
+            logger.info(f"Dedup signatures built for {len(rows)} jobs")
+
+    def _bump_data_version(self):
+        self.conn.execute(
+            """
+            INSERT INTO meta(key, value) VALUES ('data_version', 1)
+            ON CONFLICT(key) DO UPDATE SET value = value + 1
+            """
+        )
+
+    def data_version(self) -> int:
+        """
+        Counter bumped by every write that changes job data; caches key on it
+        """
+        with self.manager.reader() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()
+        return row[0] if row else 0
+
+    def _ids_for_hashes(self, keys: List[str]) -> Dict[str, int]:
+        ids: Dict[str, int] = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            ids.update(self.conn.execute(
+                f"SELECT content_hash, id FROM jobs WHERE content_hash IN ({placeholders})",
+                chunk,
+            ))
+        return ids
+
+    def _index_skills(self, descriptions: Dict[int, str]):
+        """
+        (Re)extract skills for the given job ids; callers own the transaction
+        """
+        self.conn.executemany("DELETE FROM job_skills WHERE job_id = ?", ((i,) for i in descriptions))
+        with profiling.stage("extract"):
+            matrix = self.skill_extractor.extract_matrix(list(descriptions.values()))
+            found = self.skill_extractor.skill_lists(matrix)
+        self.conn.executemany(
+            "INSERT INTO job_skills (job_id, skill) VALUES (?, ?)",
+            ((job_id, skill) for job_id, skills in zip(descriptions, found) for skill in skills),
+        )
+
+    def _store_descriptions(self, descriptions: Iterable[Optional[str]]) -> List[Optional[bytes]]:
+        """
+        Hash every description and store (compressed, see _deflate) the ones not stored yet;
+        returns the hashes in order.
+        Callers own the transaction.
+        """
+        texts: Dict[bytes, str] = {}
+        hashes = []
+        for text in descriptions:
+            key = _description_hash(text)
+            hashes.append(key)
+            if key is not None:
+                texts[key] = text
+
+        keys = list(texts)
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for (key,) in self.conn.execute(
+                f"SELECT hash FROM job_descriptions WHERE hash IN ({placeholders})",
+                chunk,
+            ):
+                del texts[key]
+
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO job_descriptions (hash, size, body) VALUES (?, ?, ?)",
+            ((key, len(data), _deflate(data)) for key, data in
+             ((key, text.encode("utf-8")) for key, text in texts.items())),
+        )
+        return hashes
+
+    def _prune_descriptions(self):
+        self.conn.execute(
+            """
+            DELETE FROM job_descriptions
+            WHERE NOT EXISTS (SELECT 1 FROM jobs WHERE jobs.description_hash = job_descriptions.hash)
+            """
+        )
+
+    def _indexed_text(self, keys: List[str]) -> Dict[str, tuple]:
+        """
+        content_hash -> (id, title, description) as currently stored, i.e. as last indexed for search
+        """
+        stored: Dict[str, tuple] = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for key, job_id, title, body in self.conn.execute(
+                f"""
+                SELECT jobs.content_hash, jobs.id, jobs.title, d.body FROM jobs
+                LEFT JOIN job_descriptions d ON d.hash = jobs.description_hash
+                WHERE jobs.content_hash IN ({placeholders})
+                """,
+                chunk,
+            ):
+                stored[key] = (job_id, title, _inflate(body))
+        return stored
 
-    def fetch_all_jobs(self):
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM jobs")
-        return cursor.fetchall()
+    def _index_text(self, texts: Dict[int, tuple]):
+        """
+        Add job id -> (title, description) to the search index; callers own the transaction
+        """
+        self.conn.executemany(
+            "INSERT INTO jobs_fts (rowid, title, description) VALUES (?, ?, ?)",
+            ((job_id, title, description) for job_id, (title, description) in texts.items()),
+        )
+
+    def _unindex_text(self, texts: Dict[int, tuple]):
+        """
+        Remove job id -> (title, description) from the search index. A contentless index
+        needs exactly the values that were indexed, so these must be the stored ones.
+        """
+        self.conn.executemany(
+            "INSERT INTO jobs_fts (jobs_fts, rowid, title, description) VALUES ('delete', ?, ?, ?)",
+            ((job_id, title, description) for job_id, (title, description) in texts.items()),
+        )
+
+    def _index_signatures(self, postings: Dict[int, tuple], sketches: Optional[Dict[int, tuple]] = None):
+        """
+        Store MinHash signatures and LSH buckets for job id -> (title, company, description),
+        reusing any sketches already computed for those ids; callers own the transaction
+        """
+        sketches = sketches or {}
+        self.conn.executemany("DELETE FROM lsh_buckets WHERE job_id = ?", ((i,) for i in postings))
+
+        signatures, buckets = [], []
+        for job_id, posting in postings.items():
+            signature, company, bands = sketches.get(job_id) or self.minhasher.sketch(*posting)
+            signatures.append((job_id, company, self.minhasher.to_blob(signature)))
+            buckets.extend((band, bucket, job_id) for band, bucket in enumerate(bands))
+
+        self.conn.executemany("INSERT OR REPLACE INTO job_signatures VALUES (?, ?, ?)", signatures)
+        self.conn.executemany("INSERT OR IGNORE INTO lsh_buckets VALUES (?, ?, ?)", buckets)
+
+    def _find_near_duplicates(self, jobs: Dict[str, JobRow]) -> Tuple[Dict[str, Union[int, str]], Dict[str, tuple]]:
+        """
+        Map each new posting that near-duplicates a live stored job to that job's id, or one
+        that near-duplicates an earlier posting of the same batch to that posting's hash.
+        Only pairs from different sources in the same (or an unknown) city count, see dedup.same_job.
+        Also returns the sketch computed for every posting, to be stored for those that are kept.
+        """
+        from core.dedup import same_job
+
+        minhasher = self.minhasher
+        sketches = {key: minhasher.sketch(job.title, job.company, job.description) for key, job in jobs.items()}
+        origins: Dict[object, tuple] = {key: (job.source, resolve_location(job.location)[0]) for key, job in jobs.items()}
+        new = {key: (signature, company) for key, (signature, company, _) in sketches.items()}
+        keys = {key: bands for key, (_, _, bands) in sketches.items()}
+
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS lsh_probe (band INTEGER, bucket INTEGER, key TEXT)")
+        self.conn.execute("DELETE FROM lsh_probe")
+        self.conn.executemany(
+            "INSERT INTO lsh_probe VALUES (?, ?, ?)",
+            ((band, bucket, key) for key, bands in keys.items() for band, bucket in enumerate(bands)),
+        )
+        pairs = self.conn.execute(
+            """
+            SELECT DISTINCT p.key, b.job_id FROM lsh_probe p
+            JOIN lsh_buckets b ON b.band = p.band AND b.bucket = p.bucket
+            JOIN jobs ON jobs.id = b.job_id AND jobs.is_stale = 0
+            ORDER BY p.key, b.job_id
+            """
+        ).fetchall()
+
+        stored: Dict[object, tuple] = {}
+        job_ids = sorted({job_id for _, job_id in pairs})
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for job_id, company, blob, source, city in self.conn.execute(
+                f"""
+                SELECT s.job_id, s.company_key, s.signature, jobs.source, jobs.city FROM job_signatures s
+                JOIN jobs ON jobs.id = s.job_id
+                WHERE s.job_id IN ({placeholders})
+                """,
+                chunk,
+            ):
+                stored[job_id] = (minhasher.from_blob(blob), company)
+                origins[job_id] = (source, city)
+
+        pairs = [(key, job_id) for key, job_id in pairs if job_id in origins and same_job(origins[key], origins[job_id])]
+        duplicates = minhasher.find_duplicates(new, stored, pairs)
+
+        # Postings of this batch can also duplicate each other: the first one seen is kept
+        buckets: Dict[tuple, List[str]] = {}
+        batch_pairs: Dict[tuple, None] = {}
+        for key, bands in keys.items():
+            if key in duplicates:
+                continue
+            for band, bucket in enumerate(bands):
+                earlier = buckets.setdefault((band, bucket), [])
+                batch_pairs.update(((key, other), None) for other in earlier if same_job(origins[key], origins[other]))
+                earlier.append(key)
+
+        remaining = {key: value for key, value in new.items() if key not in duplicates}
+        duplicates.update(minhasher.find_duplicates(remaining, new, batch_pairs))
+
+        # A batch posting may have been matched to one that is itself a duplicate
+        for key, target in duplicates.items():
+            while target in duplicates:
+                target = duplicates[target]
+            duplicates[key] = target
+        return duplicates, sketches
+
+    def insert_jobs(self, jobs: Union[List[JobPosting], JobBatch]):
+        query = f"""
+        INSERT OR IGNORE INTO jobs ({', '.join(STORED_COLUMNS)}, domain, content_hash, row_hash, first_seen, updated_at,
+                                    last_seen, {', '.join(DERIVED_COLUMNS)})
+        VALUES ({', '.join('?' * (len(STORED_COLUMNS) + 6 + len(DERIVED_COLUMNS)))})
+        """
+
+        start = time.perf_counter()
+        batch = jobs if isinstance(jobs, JobBatch) else JobBatch(jobs)
+        now = _utc_now()
+
+        keyed = [(content_hash(row), row) for row in batch.rows()]
+
+        with self.manager.write(), self.conn:
+            self._carry_forward_rollups()
+            stored_before = self._ids_for_hashes([key for key, _ in keyed])
+
+            # Only the first posting of each new key gets past INSERT OR IGNORE
+            added: Dict[str, JobRow] = {}
+            for key, row in keyed:
+                if key not in stored_before:
+                    added.setdefault(key, row)
+            self._store_descriptions(row.description for row in added.values())
+            self.conn.executemany(query, (
+                _stored_values(row) + (row.domain, key, row_hash(row), now, now, now) + _derived(row)
+                for key, row in added.items()
+            ))
+
+            # Rows already stored are left as they are, so only the new ones are indexed
+            ids = self._ids_for_hashes(list(added))
+            self._index_text({ids[key]: (row.title, row.description) for key, row in added.items()})
+            self._index_skills({ids[key]: row.description for key, row in added.items()})
+            self._index_signatures({ids[key]: (row.title, row.company, row.description) for key, row in added.items()})
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO job_sources VALUES (?, ?, ?, ?, ?, ?)",
+                ((key, ids[key], row.source, row.apply_link, now, now) for key, row in added.items()),
+            )
+            self._bump_data_version()
+        metrics.observe("db.insert_jobs", time.perf_counter() - start, len(batch))
+        logger.info(f"{len(batch)} jobs inserted into database")
+
+    def upsert_jobs(
+        self,
+        jobs: List[JobPosting],
+        domain: Optional[str] = None,
+        stale_domains: Optional[Iterable[str]] = None,
+    ) -> Dict[str, int]:
+        """
+        Merge a fresh fetch into the table: new postings are inserted, changed ones updated,
+        unchanged ones left alone, and postings of the fetched domains missing from it marked stale.
+        Each job is stored under job.domain, falling back to domain. stale_domains defaults to [domain].
+        """
+        return self.upsert_stream([jobs], domain, stale_domains, batch_size=max(1, len(jobs)))
+
+    def upsert_stream(
+        self,
+        pages: Iterable[Union[List[JobPosting], JobBatch]],
+        domain: Optional[str] = None,
+        stale_domains: Optional[Iterable[str]] = None,
+        batch_size: int = 500,
+        on_batch: Optional[Callable[[Dict[str, int]], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        Streaming form of upsert_jobs: pages are regrouped into batches of batch_size and each
+        batch is merged in its own transaction, so memory stays bounded however long the stream
+        (every job a batch sees gets the stream's start time as last_seen, in the table itself).
+        Staleness is decided once the stream is exhausted, and only for domains that yielded
+        at least one posting, so a failed fetch never retires a whole domain.
+        The writer is only held while a batch is merged, never while pages are being fetched,
+        so other writes interleave with a long ingest; the stale sweep only retires jobs last
+        seen before this stream started, so it spares those another writer stored meanwhile. Queries on other threads keep seeing the
+        last committed batch throughout.
+        """
+        start = time.perf_counter()
+        now = _utc_now()
+        totals = {"inserted": 0, "updated": 0, "unchanged": 0, "duplicates": 0, "stale": 0}
+        seen_domains = set()
+
+        def flush(batch: JobBatch):
+            with metrics.span("db.merge_batch") as span, profiling.stage("store"), self.manager.write():
+                span.items = len(batch)
+                result = self._merge_batch(batch, domain, now)
+            seen_domains.update(job_domain or domain for job_domain in batch.domain)
+            for key, value in result.items():
+                totals[key] += value
+            if on_batch is not None:
+                on_batch(result)
+
+        batch = JobBatch()
+        for page in pages:
+            batch.extend(page)
+            while len(batch) >= batch_size:
+                flush(batch[:batch_size])
+                batch = batch[batch_size:]
+
+        if batch:
+            flush(batch)
+
+        scopes = [domain] if stale_domains is None else list(stale_domains)
+
+        with self.manager.write(), self.conn:
+            self._carry_forward_rollups()
+            for scope in scopes:
+                if scope not in seen_domains:
+                    continue
+                totals["stale"] += self.conn.execute(
+                    """
+                    UPDATE jobs SET is_stale = 1, updated_at = ?
+                    WHERE domain IS ? AND is_stale = 0 AND COALESCE(last_seen, '') < ?
+                    """,
+                    (now, scope, now),
+                ).rowcount
+
+            if totals["stale"]:
+                self._bump_data_version()
+
+            # Edited postings may have left descriptions no job points to any more
+            if totals["updated"]:
+                self._prune_descriptions()
+
+        for outcome, rows in totals.items():
+            metrics.count("db.rows", rows, outcome=outcome)
+        received = totals["inserted"] + totals["updated"] + totals["unchanged"] + totals["duplicates"]
+        metrics.observe("db.upsert_stream", time.perf_counter() - start, received)
+        logger.info(f"Upsert finished: {totals}")
+        return totals
+
+    def _merge_batch(self, jobs: JobBatch, domain: Optional[str], now: str) -> Dict[str, int]:
+        """
+        Insert/update one batch in a single transaction and set last_seen = now on every job it saw.
+        A new posting that near-duplicates a live job (or an earlier posting of the batch)
+        is not stored again: it is recorded in job_sources against that canonical job instead.
+        """
+        incoming: Dict[str, JobRow] = {content_hash(row): row for row in jobs.rows()}
+        keys = list(incoming)
+
+        existing: Dict[str, tuple] = {}
+        aliases: Dict[str, tuple] = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for key, job_id, fingerprint, is_stale, stored_domain in self.conn.execute(
+                f"SELECT content_hash, id, row_hash, is_stale, domain FROM jobs WHERE content_hash IN ({placeholders})",
+                chunk,
+            ):
+                existing[key] = (job_id, fingerprint, is_stale, stored_domain)
+            # Postings already collapsed into another job on an earlier ingest
+            for key, job_id, canonical, is_stale in self.conn.execute(
+                f"""
+                SELECT js.content_hash, jobs.id, jobs.content_hash, jobs.is_stale FROM job_sources js
+                JOIN jobs ON jobs.id = js.job_id
+                WHERE js.content_hash IN ({placeholders}) AND js.content_hash != jobs.content_hash
+                """,
+                chunk,
+            ):
+                aliases[key] = (job_id, canonical, is_stale)
+
+        new_keys = [key for key in keys if key not in existing and key not in aliases]
+        near, sketches = self._find_near_duplicates({key: incoming[key] for key in new_keys})
+
+        inserts, updates, revived, adopted = [], [], [], []
+        touched: List[str] = []
+        changed: List[str] = []
+
+        for key, job in incoming.items():
+            fingerprint = row_hash(job)
+
+            job_domain = job.domain or domain
+
+            if key in aliases or key in near:
+                continue
+            elif key not in existing:
+                inserts.append(_stored_values(job) + (key, fingerprint, job_domain, now, now) + _derived(job))
+                changed.append(key)
+            elif existing[key][1] != fingerprint:
+                updates.append(_stored_values(job) + (fingerprint,) + _derived(job) + (job_domain, now, key))
+                changed.append(key)
+            elif existing[key][2]:
+                revived.append((job_domain, now, key))
+            else:
+                if existing[key][3] is None and job_domain is not None:
+                    # Legacy rows stored before domains existed take the domain they are fetched for
+                    adopted.append((job_domain, key))
+                continue
+            touched.append(key)
+
+        # A duplicate seen from another source keeps (or brings back) its canonical job
+        revived_canonical = {canonical for _, canonical, is_stale in aliases.values() if is_stale}
+
+        with self.conn:
+            self._carry_forward_rollups()
+            self._store_descriptions(incoming[key].description for key in changed)
+            indexed = self._indexed_text([row[-1] for row in updates])
+
+            self.conn.executemany(
+                f"""
+                INSERT INTO jobs ({', '.join(STORED_COLUMNS)}, content_hash, row_hash, domain, first_seen, updated_at,
+                                  {', '.join(DERIVED_COLUMNS)})
+                VALUES ({', '.join('?' * (len(STORED_COLUMNS) + 5 + len(DERIVED_COLUMNS)))})
+                """,
+                inserts,
+            )
+            self.conn.executemany(
+                f"""
+                UPDATE jobs SET {', '.join(f'{c} = ?' for c in STORED_COLUMNS)},
+                    row_hash = ?, {', '.join(f'{c} = ?' for c in DERIVED_COLUMNS)},
+                    domain = COALESCE(domain, ?), is_stale = 0, updated_at = ?
+                WHERE content_hash = ?
+                """,
+                updates,
+            )
+            self.conn.executemany(
+                "UPDATE jobs SET domain = COALESCE(domain, ?), is_stale = 0, updated_at = ? WHERE content_hash = ?",
+                revived + [(None, now, key) for key in revived_canonical],
+            )
+            self.conn.executemany("UPDATE jobs SET domain = ? WHERE content_hash = ? AND domain IS NULL", adopted)
+
+            ids = self._ids_for_hashes(touched)
+            skills = {ids[key]: incoming[key].description for key in touched}
+            # Going stale dropped their skills too; they come back from the stored description
+            skills.update({job_id: description for job_id, _, description in
+                           self._indexed_text(list(revived_canonical)).values()})
+            self._index_skills(skills)
+
+            # Only titles and descriptions are searchable: other edits leave the search index alone
+            reindexed = [
+                key for key in changed
+                if key not in indexed or indexed[key][1:] != (incoming[key].title, incoming[key].description)
+            ]
+            self._unindex_text({indexed[key][0]: indexed[key][1:] for key in reindexed if key in indexed})
+            self._index_text({ids[key]: (incoming[key].title, incoming[key].description) for key in reindexed})
+            self._index_signatures(
+                {ids[key]: (incoming[key].title, incoming[key].company, incoming[key].description) for key in changed},
+                {ids[key]: sketch for key, sketch in sketches.items() if key in ids},
+            )
+
+            canonical_ids = {key: existing[key][0] for key in existing}
+            canonical_ids.update({key: ids[key] for key in changed})
+            canonical_ids.update({key: job_id for key, (job_id, _, _) in aliases.items()})
+            canonical_ids.update({
+                key: target if isinstance(target, int) else canonical_ids[target] for key, target in near.items()
+            })
+
+            self.conn.executemany(
+                """
+                INSERT INTO job_sources VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(content_hash) DO UPDATE SET last_seen = excluded.last_seen
+                """,
+                (
+                    (key, canonical_ids[key], job.source, job.apply_link, now, now)
+                    for key, job in incoming.items()
+                ),
+            )
+
+            # Unchanged postings too, and the canonical job of every duplicate, so the stale sweep spares them
+            self.conn.executemany(
+                "UPDATE jobs SET last_seen = ? WHERE id = ?",
+                ((now, job_id) for job_id in set(canonical_ids.values())),
+            )
+
+            if touched or revived_canonical or adopted:
+                self._bump_data_version()
+
+        duplicates = len(aliases) + len(near)
+        return {
+            "inserted": len(inserts),
+            "updated": len(updates) + len(revived),
+            "unchanged": len(incoming) - len(inserts) - len(updates) - len(revived) - duplicates,
+            "duplicates": duplicates,
+        }
+
+    def fetch_all_jobs(self, domain: Optional[str] = None, columns: Sequence[str] = JOB_COLUMNS):
+        """
+        (id, *columns) of every live job; descriptions are only read and decompressed if asked for
+        """
+        query = _select_jobs(columns) + " WHERE is_stale = 0"
+
+        with self.manager.reader() as conn:
+            if domain is None:
+                rows = conn.execute(query).fetchall()
+            else:
+                rows = conn.execute(query + " AND domain = ?", (domain,)).fetchall()
+        return _inflate_rows(rows, columns)
+
+    def skill_counts(self, domain: Optional[str] = None) -> Dict[str, int]:
+        """
+        Number of live jobs asking for each skill, optionally within one domain
+        """
+        with self.manager.reader() as conn:
+            if domain is None:
+                cursor = conn.execute("SELECT skill, count FROM skill_counts WHERE count > 0")
+            else:
+                cursor = conn.execute(
+                    """
+                    SELECT js.skill, COUNT(*) FROM jobs
+                    JOIN job_skills js ON js.job_id = jobs.id
+                    WHERE jobs.domain = ? AND jobs.is_stale = 0
+                    GROUP BY js.skill
+                    """,
+                    (domain,),
+                )
+            return dict(cursor.fetchall())
+
+    def job_ids_with_skill(self, skill: str) -> List[int]:
+        with self.manager.reader() as conn:
+            cursor = conn.execute("SELECT job_id FROM job_skills WHERE skill = ?", (skill.lower(),))
+            return [row[0] for row in cursor]
+
+    def iter_job_skills(self):
+        """
+        (job_id, skill) pairs for every live job, grouped by skill
+        """
+        with self.manager.reader() as conn:
+            yield from conn.execute("SELECT job_id, skill FROM job_skills ORDER BY skill, job_id")
+
+    def fetch_jobs_by_ids(self, job_ids: List[int], columns: Sequence[str] = JOB_COLUMNS):
+        """
+        (id, *columns) rows for the given ids, in the order the ids were given
+        """
+        if not job_ids:
+            return []
+
+        placeholders = ", ".join("?" * len(job_ids))
+        with self.manager.reader() as conn:
+            cursor = conn.execute(
+                _select_jobs(columns) + f" WHERE jobs.id IN ({placeholders})",
+                list(job_ids),
+            )
+            rows = {row[0]: row for row in _inflate_rows(cursor.fetchall(), columns)}
+        return [rows[i] for i in job_ids if i in rows]
+
+    def sources_for_jobs(self, job_ids: List[int]) -> Dict[int, List[str]]:
+        """
+        Every source each job was seen on, its own and those of postings collapsed into it
+        """
+        sources: Dict[int, List[str]] = {}
+        with self.manager.reader() as conn:
+            for start in range(0, len(job_ids), 500):
+                chunk = job_ids[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                for job_id, source in conn.execute(
+                    f"SELECT DISTINCT job_id, source FROM job_sources WHERE job_id IN ({placeholders}) ORDER BY first_seen",
+                    chunk,
+                ):
+                    sources.setdefault(job_id, []).append(source)
+        return sources
+
+    def search_jobs(self, query: str, limit: int = 25, offset: int = 0):
+        """
+        Full-text search over title and description, best matches first.
+        Pass limit=-1 for every match.
+        """
+        match = _fts_query(query)
+        if not match:
+            return []
+
+        with self.manager.reader() as conn:
+            rows = conn.execute(
+                _select_jobs(JOB_COLUMNS) + """
+                JOIN jobs_fts ON jobs_fts.rowid = jobs.id
+                WHERE jobs_fts MATCH ? AND jobs.is_stale = 0
+                ORDER BY jobs_fts.rank
+                LIMIT ? OFFSET ?
+                """,
+                (match, limit, offset),
+            ).fetchall()
+        return _inflate_rows(rows, JOB_COLUMNS)
+
+    def search_job_ids(self, query: str) -> List[int]:
+        """
+        Ids of every live job matching a full-text query, for filtering an already loaded frame
+        """
+        match = _fts_query(query)
+        if not match:
+            return []
+
+        with self.manager.reader() as conn:
+            cursor = conn.execute(
+                """
+                SELECT jobs.id FROM jobs_fts
+                JOIN jobs ON jobs.id = jobs_fts.rowid
+                WHERE jobs_fts MATCH ? AND jobs.is_stale = 0
+                """,
+                (match,),
+            )
+            return [row[0] for row in cursor]
+
+    def job_page(self, job_filter: JobFilter, after_id: Optional[int] = None, limit: int = 25) -> List[tuple]:
+        """
+        One page of (id, title, company, city, apply_link, salary_min, salary_max,
+        experience_min, experience_max) rows, newest first.
+        Keyset pagination: pass the last id of the previous page as after_id, so
+        every page costs the same however deep it is.
+        """
+        where, params = _filter_sql(job_filter)
+        if after_id is not None:
+            where += " AND id < ?"
+            params.append(after_id)
+
+        with metrics.span("db.query", query="job_page"), self.manager.reader() as conn:
+            return conn.execute(
+                f"""
+                SELECT id, title, company, city, apply_link, salary_min, salary_max, experience_min, experience_max
+                FROM jobs WHERE {where} ORDER BY id DESC LIMIT ?
+                """,
+                params + [limit],
+            ).fetchall()
+
+    def job_totals(self, job_filter: JobFilter) -> Dict[str, int]:
+        """
+        Number of matching jobs and of distinct companies and cities among them
+        """
+        where, params = _filter_sql(job_filter)
+        with metrics.span("db.query", query="job_totals"), self.manager.reader() as conn:
+            jobs, companies, cities = conn.execute(
+                f"SELECT COUNT(*), COUNT(DISTINCT company), COUNT(DISTINCT city) FROM jobs WHERE {where}",
+                params,
+            ).fetchone()
+        return {"jobs": jobs, "companies": companies, "cities": cities}
+
+    def _counts_by(self, column: str, job_filter: JobFilter, limit: Optional[int]) -> List[Tuple[str, int]]:
+        where, params = _filter_sql(job_filter)
+        with metrics.span("db.query", query=f"{column}_counts"), self.manager.reader() as conn:
+            return conn.execute(
+                f"""
+                SELECT {column}, COUNT(*) AS n FROM jobs
+                WHERE {where} AND {column} IS NOT NULL
+                GROUP BY {column} ORDER BY n DESC, {column}
+                LIMIT ?
+                """,
+                params + [-1 if limit is None else limit],
+            ).fetchall()
+
+    def company_counts(self, job_filter: JobFilter, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        (company, jobs) for the matching jobs, most jobs first
+        """
+        return self._counts_by("company", job_filter, limit)
+
+    def city_counts(self, job_filter: JobFilter, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        (city, jobs) for the matching jobs, most jobs first
+        """
+        return self._counts_by("city", job_filter, limit)
+
+    def state_counts(self, job_filter: JobFilter, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        (state, jobs) for the matching jobs, most jobs first
+        """
+        return self._counts_by("state", job_filter, limit)
+
+    def skill_trend(
+        self, skills: List[str], domain: Optional[str] = None, since: Optional[str] = None
+    ) -> List[Tuple[str, str, int]]:
+        """
+        (date, skill, live jobs asking for it) for every ingest day since the given ISO date,
+        oldest first. Reads skill_demand_daily only; domain None sums every domain.
+        """
+        if not skills:
+            return []
+
+        placeholders = ", ".join("?" * len(skills))
+        params = [skill.lower() for skill in skills] + [since or ""]
+        if domain is None:
+            query = f"""
+            SELECT date, skill, SUM(count) FROM skill_demand_daily
+            WHERE skill IN ({placeholders}) AND date >= ?
+            GROUP BY date, skill ORDER BY date, skill
+            """
+        else:
+            query = f"""
+            SELECT date, skill, count FROM skill_demand_daily
+            WHERE domain = ? AND skill IN ({placeholders}) AND date >= ?
+            ORDER BY date, skill
+            """
+            params.insert(0, domain)
+
+        with self.manager.reader() as conn:
+            return conn.execute(query, params).fetchall()
+
+    def postings_trend(self, domain: Optional[str] = None, since: Optional[str] = None) -> List[Tuple[str, int, int, int]]:
+        """
+        (date, live, opened, closed) for every ingest day since the given ISO date, oldest first
+        """
+        query = "SELECT date, SUM(live), SUM(opened), SUM(closed) FROM postings_daily WHERE date >= ?"
+        params = [since or ""]
+        if domain is not None:
+            query += " AND domain = ?"
+            params.append(domain)
+
+        with self.manager.reader() as conn:
+            return conn.execute(query + " GROUP BY date ORDER BY date", params).fetchall()
 
     def clear_jobs(self):
         """
         Delete all old jobs before inserting fresh jobs
         """
         query = "DELETE FROM jobs"
-        self.conn.execute(query)
-        self.conn.commit()
+        with self.manager.write(), self.conn:
+            self._carry_forward_rollups()
+            self.conn.execute(query)
+            self.conn.execute("DELETE FROM job_descriptions")
+            self.conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('delete-all')")
+            self._bump_data_version()
         logger.info("Old jobs cleared from database")
+
+    def storage_report(self) -> Dict[str, int]:
+        """
+        Bytes on disk per table (indexes included) and the raw vs compressed size of the stored descriptions
+        """
+        with self.manager.reader() as conn:
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            jobs, live = conn.execute("SELECT COUNT(*), COUNT(*) - SUM(is_stale) FROM jobs").fetchone()
+            descriptions, raw, compressed = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(body)), 0) FROM job_descriptions"
+            ).fetchone()
+            try:
+                tables = dict(conn.execute(
+                    """
+                    SELECT COALESCE(m.tbl_name, s.name), SUM(s.pgsize) FROM dbstat s
+                    LEFT JOIN sqlite_master m ON m.name = s.name
+                    GROUP BY 1
+                    """
+                ))
+            except sqlite3.OperationalError:
+                tables = {}   # SQLite built without the dbstat table
+
+        report = {
+            "file_bytes": page_count * page_size,
+            "jobs": jobs,
+            "live_jobs": live or 0,
+            "descriptions": descriptions,
+            "description_bytes_raw": raw,
+            "description_bytes_stored": compressed,
+        }
+        report.update({f"table_bytes.{name}": size for name, size in sorted(tables.items())})
+        return report
@@ -1,5 +1,6 @@
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
 
 
 @dataclass
@@ -12,3 +13,126 @@ class JobPosting:
     salary: Optional[str] = None
     source: Optional[str] = None
     apply_link: str = None
+    domain: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class JobFilter:
+    """
+    Dashboard filters; None means "any". search is full-text over title and description.
+    Salary and experience filters only match jobs whose salary / experience is known.
+    """
+    domain: Optional[str] = None
+    state: Optional[str] = None
+    city: Optional[str] = None
+    company: Optional[str] = None
+    skill: Optional[str] = None
+    search: Optional[str] = None
+    min_salary: Optional[int] = None        # annual INR; jobs whose range reaches it
+    min_experience: Optional[float] = None  # years; jobs whose range overlaps [min, max]
+    max_experience: Optional[float] = None
+
+
+class CompactJobPosting:
+    """
+    JobPosting with __slots__ instead of a per-instance __dict__
+    """
+
+    __slots__ = ("title", "company", "location", "description", "experience",
+                 "salary", "source", "apply_link", "domain")
+
+    def __init__(self, title: str, company: str, location: str, description: str,
+                 experience: Optional[str] = None, salary: Optional[str] = None,
+                 source: Optional[str] = None, apply_link: str = None,
+                 domain: Optional[str] = None):
+        self.title = title
+        self.company = company
+        self.location = location
+        self.description = description
+        self.experience = experience
+        self.salary = salary
+        self.source = source
+        self.apply_link = apply_link
+        self.domain = domain
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"CompactJobPosting({fields})"
+
+    def __eq__(self, other):
+        if not isinstance(other, (CompactJobPosting, JobPosting)):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+
+class JobRow(NamedTuple):
+    """
+    One posting read out of a JobBatch: a plain tuple with JobPosting's field names
+    """
+    title: str
+    company: str
+    location: str
+    description: str
+    experience: Optional[str] = None
+    salary: Optional[str] = None
+    source: Optional[str] = None
+    apply_link: str = None
+    domain: Optional[str] = None
+
+
+class JobBatch:
+    """
+    Columnar container for many postings: one parallel list per field.
+    Company, location, source and domain repeat heavily across postings,
+    so they are interned and every repeat shares one string object.
+    """
+
+    FIELDS = JobRow._fields
+    INTERNED = ("company", "location", "source", "domain")
+
+    __slots__ = FIELDS
+
+    def __init__(self, jobs: Iterable = ()):
+        for name in self.FIELDS:
+            setattr(self, name, [])
+        self.extend(jobs)
+
+    def append(self, title: str, company: str, location: str, description: str,
+               experience: Optional[str] = None, salary: Optional[str] = None,
+               source: Optional[str] = None, apply_link: str = None,
+               domain: Optional[str] = None):
+        row = JobRow(title, company, location, description, experience, salary, source, apply_link, domain)
+        for name, value in zip(self.FIELDS, row):
+            if name in self.INTERNED and isinstance(value, str):
+                value = sys.intern(value)
+            getattr(self, name).append(value)
+
+    def extend(self, jobs: Iterable):
+        if isinstance(jobs, JobBatch):
+            for name in self.FIELDS:
+                getattr(self, name).extend(getattr(jobs, name))
+            return
+
+        for job in jobs:
+            self.append(*(getattr(job, name, None) for name in self.FIELDS))
+
+    def rows(self) -> Iterator[JobRow]:
+        """
+        One JobRow per posting, without building posting objects
+        """
+        return map(JobRow._make, zip(*(getattr(self, name) for name in self.FIELDS)))
+
+    def __len__(self):
+        return len(self.title)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[CompactJobPosting, "JobBatch"]:
+        if isinstance(index, slice):
+            batch = JobBatch()
+            for name in self.FIELDS:
+                setattr(batch, name, getattr(self, name)[index])
+            return batch
+        return CompactJobPosting(*(getattr(self, name)[index] for name in self.FIELDS))
+
+    def __iter__(self) -> Iterator[CompactJobPosting]:
+        for row in self.rows():
+            yield CompactJobPosting(*row)
@@ -1,32 +1,98 @@
+import argparse
 from core.adzuna_scraper import AdzunaScraper
+from core.ingest import DOMAIN_KEYWORDS, ingest_domains
+from core.sources import available_sources, build_sources, enabled_sources
 from db.database import JobDatabase
-from core.skill_extractor import SkillExtractor
+from utils.metrics import METRICS_FILE, metrics
+from utils.profiling import PROFILE_DIR, profile_run
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Fetch job domains and merge them into jobs.db")
+    parser.add_argument(
+        "--domain",
+        action="append",
+        choices=list(DOMAIN_KEYWORDS),
+        help="Domain to ingest (repeatable). Defaults to all domains.",
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=None,
+        help="Pages to fetch per domain (50 jobs each). Defaults to the scraper's safety limit.",
+    )
+    parser.add_argument(
+        "--source",
+        action="append",
+        choices=available_sources(),
+        help=f"Job source to fetch from (repeatable). Defaults to the enabled ones: {', '.join(enabled_sources())}.",
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="Jobs written per transaction.")
+    parser.add_argument(
+        "--metrics-out",
+        default=METRICS_FILE,
+        help="Write stage timings and counters here when done: a .jsonl file is appended to, "
+             "any other path gets the Prometheus text format. Defaults to $JOBVISTA_METRICS_FILE.",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        default=PROFILE_DIR,
+        help="Profile the run with cProfile and tracemalloc, writing per-stage (fetch/store/extract) "
+             "pstats files, allocation reports and a time and memory summary under DIR. "
+             "Defaults to $JOBVISTA_PROFILE_DIR.",
+    )
+    args = parser.parse_args()
+
+    try:
+        with profile_run(args.profile):
+            run(args)
+    finally:
+        written = metrics.export(args.metrics_out)
+        if written:
+            print(f"\n📊 Metrics written to {written}")
+
+
+def run(args):
     print("\n🚀 JobVista India Backend Pipeline\n")
 
-    # Default domain (used only if running main.py manually)
-    keyword = "software developer"
+    domains = args.domain or list(DOMAIN_KEYWORDS)
+
+    # Stream every (source, domain) pair concurrently into the store, one bounded batch at a time
+    db = JobDatabase()
+    sources = build_sources(args.source)
+    for source in sources:
+        if isinstance(source, AdzunaScraper) and args.max_pages:
+            source.max_pages = args.max_pages
+
+    def report(batch):
+        print(f"  batch stored: {batch['inserted']} new, {batch['updated']} updated, "
+              f"{batch['unchanged']} unchanged, {batch['duplicates']} duplicates")
 
-    scraper = AdzunaScraper()
-    jobs = scraper.fetch_jobs(keyword)
+    with metrics.span("pipeline.ingest"):
+        result = ingest_domains(db, domains, sources, batch_size=args.batch_size, on_batch=report)
 
-    print(f"Total jobs fetched: {len(jobs)}")
+    fetched = result["inserted"] + result["updated"] + result["unchanged"] + result["duplicates"]
+    print(f"Total jobs fetched: {fetched} across {len(domains)} domains")
 
-    if len(jobs) == 0:
+    print("\n📡 Sources:\n")
+    for name, stats in result["sources"].items():
+        status = "timed out" if stats["timed_out"] else f"{stats['errors']} failed" if stats["errors"] else "ok"
+        first_page = "-" if stats["first_page_seconds"] is None else f"{stats['first_page_seconds']:.2f}s"
+        print(f"{name:>16}: {stats['jobs']:>6} jobs, {stats['pages']:>4} pages, "
+              f"first page {first_page}, done in {stats['seconds']:.2f}s "
+              f"({stats['jobs_per_second']:.0f} jobs/s) [{status}]")
+
+    if fetched == 0:
         print("No jobs fetched. Exiting.")
         return
 
-    # Store fresh jobs
-    db = JobDatabase()
-    db.clear_jobs()
-    db.insert_jobs(jobs)
-    print("Database updated with latest jobs")
+    print(f"Database updated: {result['inserted']} new, {result['updated']} updated, "
+          f"{result['unchanged']} unchanged, {result['duplicates']} cross-source duplicates merged, "
+          f"{result['stale']} stale")
 
-    # Skill analysis preview (console)
-    skill_engine = SkillExtractor()
-    skill_counts = skill_engine.extract_skills_from_jobs(jobs)
+    # Skill analysis preview (console), from the index built during ingest
+    skill_counts = db.skill_counts()
 
     print("\n🔥 Top Skills in Market:\n")
 
@@ -0,0 +1,16 @@
+from typing import Optional
+
+
+def format_range(low: Optional[float], high: Optional[float], unit: str, scale: float = 1.0) -> str:
+    """
+    "12–18 LPA", "5+ yrs" or "3 yrs" from a numeric range; empty when the low end is unknown
+    """
+    if low is None:
+        return ""
+
+    low, high = low / scale, None if high is None else high / scale
+    if high is None:
+        return f"{low:g}+ {unit}"
+    if high == low:
+        return f"{low:g} {unit}"
+    return f"{low:g}–{high:g} {unit}"
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from utils.logger import logger
+
+
+CACHE_DIR = os.getenv("JOBVISTA_HTTP_CACHE_DIR", ".http_cache")
+CACHE_TTL = float(os.getenv("JOBVISTA_HTTP_CACHE_TTL", "900"))
+
+# cache  - serve fresh entries, revalidate stale ones with ETag/Last-Modified
+# record - always hit the network and store every response (refreshes recordings)
+# replay - never touch the network; a missing entry is an error
+# off    - plain requests.Session behaviour
+CACHE_MODE = os.getenv("JOBVISTA_HTTP_MODE", "cache")
+
+SECRET_PARAMS = {"app_id", "app_key", "api_key", "key", "token"}
+
+# Bodies younger than this are never pruned: another process may be about to write their entry
+PRUNE_GRACE = 300.0
+
+
+class CacheMiss(requests.RequestException):
+    """
+    Raised in replay mode when a request has no recorded response
+    """
+
+
+class CachedSession(requests.Session):
+    """
+    requests.Session with an on-disk GET cache shared by all scrapers.
+
+    Bodies are stored content-addressed under bodies/<sha256>, so identical
+    responses are kept once; entries/<sha256 of url>.json holds status,
+    headers, validators and the time the response was last confirmed fresh.
+    A refreshed page that changed leaves its old body behind, so bodies no
+    entry references any more are pruned whenever a writing session starts.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: Optional[float] = None, mode: Optional[str] = None):
+        super().__init__()
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.ttl = CACHE_TTL if ttl is None else ttl
+        self.mode = mode or CACHE_MODE
+
+        if self.mode not in ("cache", "record", "replay", "off"):
+            raise ValueError(f"Unknown HTTP cache mode: {self.mode}")
+
+        os.makedirs(os.path.join(self.cache_dir, "entries"), exist_ok=True)
+        os.makedirs(os.path.join(self.cache_dir, "bodies"), exist_ok=True)
+
+        if self.mode in ("cache", "record"):
+            self.prune()
+
+    def request(self, method, url, params=None, headers=None, **kwargs):
+        if method.upper() != "GET" or self.mode == "off":
+            return super().request(method, url, params=params, headers=headers, **kwargs)
+
+        full_url = requests.Request("GET", url, params=params).prepare().url
+        key = hashlib.sha256(full_url.encode("utf-8")).hexdigest()
+        entry = self._load_entry(key)
+
+        if self.mode == "replay":
+            if entry is None:
+                raise CacheMiss(f"No recorded response for {_redact(full_url)}")
+            return self._to_response(entry, full_url)
+
+        if self.mode == "cache" and entry is not None and time.time() - entry["stored_at"] < self.ttl:
+            return self._to_response(entry, full_url)
+
+        headers = dict(headers or {})
+        if self.mode == "cache" and entry is not None:
+            if entry["headers"].get("ETag"):
+                headers["If-None-Match"] = entry["headers"]["ETag"]
+            if entry["headers"].get("Last-Modified"):
+                headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+
+        response = super().request(method, full_url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            entry["stored_at"] = time.time()
+            self._write_json(self._entry_path(key), entry)
+            return self._to_response(entry, full_url)
+
+        if response.status_code == 200:
+            self._store(key, full_url, response)
+
+        return response
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, "entries", key + ".json")
+
+    def _body_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, "bodies", digest)
+
+    def _load_entry(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._entry_path(key), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not os.path.exists(self._body_path(entry["body"])):
+            return None
+        return entry
+
+    def _store(self, key: str, url: str, response: requests.Response):
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+
+        if not os.path.exists(self._body_path(digest)):
+            self._write_bytes(self._body_path(digest), body)
+
+        entry = {
+            "url": _redact(url),
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items()
+                        if k.lower() not in ("content-encoding", "transfer-encoding", "content-length")},
+            "body": digest,
+            "stored_at": time.time(),
+        }
+        self._write_json(self._entry_path(key), entry)
+
+    def prune(self) -> int:
+        """
+        Delete bodies no entry references (older than PRUNE_GRACE); returns how many were removed
+        """
+        referenced = set()
+        entries_dir = os.path.join(self.cache_dir, "entries")
+        for name in os.listdir(entries_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(entries_dir, name), "r") as f:
+                    referenced.add(json.load(f)["body"])
+            except (OSError, ValueError, KeyError):
+                continue
+
+        removed = 0
+        cutoff = time.time() - PRUNE_GRACE
+        for entry in os.scandir(os.path.join(self.cache_dir, "bodies")):
+            try:
+                if entry.name not in referenced and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except OSError:
+                continue
+
+        if removed:
+            logger.info(f"HTTP cache: pruned {removed} unreferenced bodies")
+        return removed
+
+    def _to_response(self, entry: dict, url: str) -> requests.Response:
+        with open(self._body_path(entry["body"]), "rb") as f:
+            body = f.read()
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = body
+        response.url = url
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+    def _write_json(self, path: str, payload: dict):
+        self._write_bytes(path, json.dumps(payload).encode("utf-8"))
+
+    @staticmethod
+    def _write_bytes(path: str, data: bytes):
+        # Write-then-rename so concurrent readers never see a partial file
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+
+def _redact(url: str) -> str:
+    """
+    Keep API credentials out of files written to the cache directory
+    """
+    parts = urlsplit(url)
+    query = [(k, "***" if k.lower() in SECRET_PARAMS else v) for k, v in parse_qsl(parts.query)]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+_shared_session: Optional[CachedSession] = None
+_shared_lock = threading.Lock()
+
+
+def get_session() -> CachedSession:
+    """
+    Process-wide cached session for scrapers that don't need their own adapters
+    """
+    global _shared_session
+
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = CachedSession()
+            logger.info(f"HTTP cache at {_shared_session.cache_dir} (mode={_shared_session.mode}, ttl={_shared_session.ttl}s)")
+        return _shared_session
@@ -0,0 +1,175 @@
+"""
+Process-wide timing spans and counters, exportable for regression tracking.
+
+    with metrics.span("db.merge_batch") as span:
+        ...
+        span.items = len(jobs)          # optional: throughput as items per second
+    metrics.count("adzuna.pages", outcome="ok")
+
+Each span name (plus its labels) keeps a count, total and max seconds and an
+item total, so recording costs a perf_counter pair and a locked dict update;
+nothing is stored per event. export() writes a Prometheus text file (for the
+node_exporter textfile collector) or appends JSON lines, by file extension.
+Set JOBVISTA_METRICS_FILE to have the CLI export after each run and the
+dashboard after each refresh and when its server exits.
+"""
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+METRICS_FILE = os.getenv("JOBVISTA_METRICS_FILE")
+PREFIX = "jobvista"
+
+Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, object]) -> Key:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Span:
+    """
+    Handle yielded by MetricsRegistry.span; set items to record a throughput
+    """
+
+    __slots__ = ("items",)
+
+    def __init__(self):
+        self.items: Optional[int] = None
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timers: Dict[Key, List[float]] = {}     # [count, total seconds, max seconds, items]
+        self._counters: Dict[Key, float] = {}
+
+    @contextmanager
+    def span(self, name: str, **labels) -> Iterator[Span]:
+        """
+        Time the block under name; it is recorded even when the block raises
+        """
+        handle = Span()
+        start = time.perf_counter()
+        try:
+            yield handle
+        finally:
+            self.observe(name, time.perf_counter() - start, handle.items, **labels)
+
+    def observe(self, name: str, seconds: float, items: Optional[int] = None, **labels):
+        """
+        Record one timing measured elsewhere
+        """
+        key = _key(name, labels)
+        with self._lock:
+            timer = self._timers.get(key)
+            if timer is None:
+                timer = self._timers[key] = [0, 0.0, 0.0, 0]
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+            timer[3] += items or 0
+
+    def count(self, name: str, value: float = 1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def reset(self):
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+
+    def snapshot(self) -> List[dict]:
+        """
+        Every span and counter as a plain dict, spans first, sorted by name
+        """
+        with self._lock:
+            timers = sorted(self._timers.items())
+            counters = sorted(self._counters.items())
+
+        records = []
+        for (name, labels), (count, total, longest, items) in timers:
+            record = {"type": "span", "name": name, "labels": dict(labels), "count": count,
+                      "seconds": round(total, 6), "max_seconds": round(longest, 6)}
+            if items:
+                record["items"] = items
+                record["items_per_second"] = round(items / total, 1) if total else None
+            records.append(record)
+        for (name, labels), value in counters:
+            records.append({"type": "counter", "name": name, "labels": dict(labels), "value": value})
+        return records
+
+    def to_prometheus(self) -> str:
+        """
+        Prometheus text exposition format: a <name>_seconds summary, <name>_seconds_max gauge and
+        <name>_items_total counter per span name, a <name>_total counter per counter name
+        """
+        families: Dict[str, Tuple[str, List[str]]] = {}
+
+        def emit(family: str, kind: str, sample: str, labels: Dict[str, str], value):
+            pairs = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            line = f"{sample}{{{pairs}}} {value}" if pairs else f"{sample} {value}"
+            families.setdefault(family, (kind, []))[1].append(line)
+
+        for record in self.snapshot():
+            base = _metric_name(record["name"])
+            labels = record["labels"]
+            if record["type"] == "span":
+                emit(f"{base}_seconds", "summary", f"{base}_seconds_count", labels, record["count"])
+                emit(f"{base}_seconds", "summary", f"{base}_seconds_sum", labels, record["seconds"])
+                emit(f"{base}_seconds_max", "gauge", f"{base}_seconds_max", labels, record["max_seconds"])
+                if "items" in record:
+                    emit(f"{base}_items_total", "counter", f"{base}_items_total", labels, record["items"])
+            else:
+                emit(f"{base}_total", "counter", f"{base}_total", labels, record["value"])
+
+        # Every sample of a family has to follow its TYPE line in one block
+        lines: List[str] = []
+        for family, (kind, samples) in families.items():
+            lines.append(f"# TYPE {family} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def to_jsonl(self) -> str:
+        """
+        One JSON object per metric, all stamped with the same export time
+        """
+        now = round(time.time(), 3)
+        return "".join(json.dumps({"ts": now, **record}) + "\n" for record in self.snapshot())
+
+    def export(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Write the metrics to path (default JOBVISTA_METRICS_FILE): a .jsonl file is appended to,
+        anything else is replaced atomically with the Prometheus text format. Returns the path written.
+        """
+        path = path or METRICS_FILE
+        if not path:
+            return None
+
+        if path.endswith(".jsonl"):
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(self.to_jsonl())
+        else:
+            # Scrapers must never see a half-written file
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus())
+            os.replace(tmp, path)
+        return path
+
+
+def _metric_name(name: str) -> str:
+    return f"{PREFIX}_" + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = MetricsRegistry()
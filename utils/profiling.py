@@ -0,0 +1,399 @@
+"""
+Opt-in cProfile / tracemalloc profiling of the ingestion stages.
+
+Off by default; set JOBVISTA_PROFILE_DIR (or pass --profile DIR to main.py) and
+every ingest run writes, under DIR/<timestamp>/:
+
+    store.pstats, extract.pstats
+                        CPU profile of each stage (load with pstats or snakeviz)
+    run.pstats          CPU profile of the rest of the run, fetch included
+    <stage>.alloc.txt   top source lines by memory allocated and kept during the stage,
+                        over a sample of its activations
+    run.alloc.txt       top source lines by memory allocated during the run and still held at its end
+    summary.json        per stage: activations, wall and CPU seconds, traced-memory and RSS peaks;
+                        run wall and CPU seconds and the time spent on snapshots
+
+Stages are "fetch" (pulling pages from the sources), "store" (merging a batch
+into SQLite) and "extract" (skill extraction, which runs inside store). They
+interleave in a streaming ingest, so each one is entered many times and
+accumulates across activations. Profiles and seconds are exclusive: store's
+leave out the extract stage nested in it.
+
+cProfile allows only one active profiler per process from Python 3.12, so the
+thread running the ingest switches between the run, store and extract
+profilers and only ever has one enabled. Fetch runs on the sources' threads
+and is profiled at the run level: from 3.12 the enabled profiler sees every
+thread (so store.pstats also holds whatever fetching overlapped it), before
+3.12 it sees only the ingest thread and fetch is timed but not profiled.
+
+Allocation diffs need two tracemalloc snapshots, so only the first few
+activations of each stage take them; clock() leaves the time they take out,
+so profiling doesn't eat into the sources' wall-clock budgets. tracemalloc and
+RSS are process-wide, so per-stage memory figures are approximate: they also
+count whatever other threads allocated at the same time. Traced peaks are
+only measured for stages on the ingest thread. With profiling off, stage() is
+an empty context manager and iterate() hands back the plain iterator.
+"""
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, TypeVar
+
+from utils.logger import logger
+
+try:
+    import resource
+except ImportError:   # Windows: no getrusage, RSS is left out of the summary
+    resource = None
+
+PROFILE_DIR = os.getenv("JOBVISTA_PROFILE_DIR")
+
+T = TypeVar("T")
+
+
+def _peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak   # macOS reports bytes
+
+
+class _StageStats:
+
+    def __init__(self):
+        self.activations = 0
+        self.seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.traced_peak: Optional[int] = None
+        self.rss_peak_kb: Optional[int] = None
+        self.rss_growth_kb = 0
+        self.snapshots = 0
+        self.allocations: Dict[str, List[int]] = defaultdict(lambda: [0, 0])   # line -> [bytes, blocks]
+
+
+class _Activation:
+    """
+    One entry of a thread's stage stack: the wall and CPU time it has been running,
+    and (on the ingest thread) the highest traced memory seen while it ran
+    """
+
+    __slots__ = ("name", "seconds", "cpu_seconds", "traced_base", "traced_peak", "_resumed")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.traced_base = 0
+        self.traced_peak = 0
+        self._resumed = (time.perf_counter(), time.thread_time())
+
+    def resume(self):
+        self._resumed = (time.perf_counter(), time.thread_time())
+
+    def pause(self):
+        self.seconds += time.perf_counter() - self._resumed[0]
+        self.cpu_seconds += time.thread_time() - self._resumed[1]
+
+
+class StageProfiler:
+    """
+    Profiles one run and attributes time, CPU profiles and memory to its stages until write_reports()
+    """
+
+    PROFILED = ("store", "extract")
+
+    def __init__(self, out_dir: str, top: int = 25, max_snapshots: int = 3, nframes: int = 1):
+        """
+        top is the number of lines in each allocation report. Allocation diffs need two
+        tracemalloc snapshots per activation, so only the first max_snapshots activations
+        of each stage take them.
+        """
+        self.out_dir = out_dir
+        self.top = top
+        self.max_snapshots = max_snapshots
+        self.nframes = nframes
+        self.stages: Dict[str, _StageStats] = defaultdict(_StageStats)
+        self.run_profile = cProfile.Profile()
+        self.profiles = {name: cProfile.Profile() for name in self.PROFILED}
+        self.overhead = 0.0   # seconds spent taking and comparing snapshots
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._owner: Optional[int] = None
+        self._enabled: List[cProfile.Profile] = []   # the ingest thread's profilers, innermost last
+        self._filters = [tracemalloc.Filter(False, tracemalloc.__file__),
+                         tracemalloc.Filter(False, __file__)]
+        self._started = (0.0, 0.0)
+        self._seconds = (0.0, 0.0)   # wall, process CPU
+        self._before: Optional[tracemalloc.Snapshot] = None
+        self._allocations: List[tracemalloc.StatisticDiff] = []
+
+    def start(self):
+        """
+        Start profiling on the calling thread, the one that runs the ingest
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+        self._owner = threading.get_ident()
+        with self._paused():
+            self._before = self._snapshot()
+        self._started = (time.perf_counter(), time.process_time())
+        self._switch_to(self.run_profile)
+
+    def stop(self):
+        self._switch_to(None)
+        self._seconds = (time.perf_counter() - self._started[0], time.process_time() - self._started[1])
+        with self._paused():
+            diff = self._snapshot().compare_to(self._before, "lineno")
+        self._allocations = [entry for entry in diff if entry.size_diff > 0]
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    @contextmanager
+    def _paused(self) -> Iterator[None]:
+        """
+        Time spent in the block (taking and comparing snapshots) is overhead, left out of clock()
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.overhead += elapsed
+                _add_overhead(elapsed)
+
+    def _switch_to(self, profile: Optional[cProfile.Profile]):
+        """
+        Make profile the only enabled one (None: back to the enclosing one), on the ingest thread
+        """
+        if self._enabled:
+            self._enabled[-1].disable()
+        if profile is None:
+            if self._enabled:
+                self._enabled.pop()
+            if self._enabled:
+                self._enabled[-1].enable()
+        else:
+            self._enabled.append(profile)
+            profile.enable()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        stack: List[_Activation] = self._local.__dict__.setdefault("stack", [])
+        if any(activation.name == name for activation in stack):
+            # Re-entered on the same thread: the outer activation already covers it
+            yield
+            return
+
+        owner = threading.get_ident() == self._owner
+        profile = self.profiles.get(name) if owner else None
+
+        # The enclosing stage's clock (and, on the ingest thread, profiler) stops until this one ends;
+        # that also keeps the snapshots out of both
+        if stack:
+            stack[-1].pause()
+        if profile is not None:
+            self._switch_to(profile)
+
+        with self._lock:
+            stats = self.stages[name]
+            sampled = stats.snapshots < self.max_snapshots
+            stats.snapshots += sampled
+        before = None
+        if sampled:
+            with self._paused():
+                before = self._snapshot()
+        rss_before = _peak_rss_kb()
+
+        activation = _Activation(name)
+        if owner:
+            # Only the ingest thread resets the (process-wide) peak, and it folds the peak so far
+            # into the stages it is nested in first, so theirs survive the reset
+            current, peak = tracemalloc.get_traced_memory()
+            for outer in stack:
+                outer.traced_peak = max(outer.traced_peak, peak)
+            activation.traced_base = activation.traced_peak = current
+            tracemalloc.reset_peak()
+
+        stack.append(activation)
+        activation.resume()
+        try:
+            yield
+        finally:
+            activation.pause()
+            stack.pop()
+
+            traced_peak = None
+            if owner:
+                activation.traced_peak = max(activation.traced_peak, tracemalloc.get_traced_memory()[1])
+                traced_peak = activation.traced_peak - activation.traced_base
+                if stack:
+                    stack[-1].traced_peak = max(stack[-1].traced_peak, activation.traced_peak)
+            rss_after = _peak_rss_kb()
+            diff = []
+            if before is not None:
+                with self._paused():
+                    diff = self._snapshot().compare_to(before, "lineno")
+
+            with self._lock:
+                stats.activations += 1
+                stats.seconds += activation.seconds
+                stats.cpu_seconds += activation.cpu_seconds
+                if traced_peak is not None:
+                    stats.traced_peak = max(stats.traced_peak or 0, traced_peak)
+                if rss_after is not None:
+                    stats.rss_peak_kb = max(stats.rss_peak_kb or 0, rss_after)
+                    stats.rss_growth_kb += rss_after - rss_before
+                for entry in diff:
+                    if entry.size_diff > 0:
+                        line = stats.allocations[str(entry.traceback)]
+                        line[0] += entry.size_diff
+                        line[1] += entry.count_diff
+
+            if profile is not None:
+                self._switch_to(None)
+            if stack:
+                stack[-1].resume()
+
+    def write_reports(self) -> str:
+        """
+        Write the pstats files, allocation reports and the summary; returns the run directory
+        """
+        run_dir = os.path.join(self.out_dir, datetime.now().strftime("%Y%m%d-%H%M%S"))
+        os.makedirs(run_dir, exist_ok=True)
+
+        pstats.Stats(self.run_profile).dump_stats(os.path.join(run_dir, "run.pstats"))
+        top = sorted(self._allocations, key=lambda entry: entry.size_diff, reverse=True)[:self.top]
+        with open(os.path.join(run_dir, "run.alloc.txt"), "w", encoding="utf-8") as f:
+            f.write("# memory allocated during the run and still held at its end\n")
+            for entry in top:
+                f.write(f"{entry.size_diff / 1024:12.1f} KiB {entry.count_diff:9d} blocks  {entry.traceback}\n")
+
+        summary: Dict[str, dict] = {}
+        for name, stats in sorted(self.stages.items()):
+            if name in self.profiles:
+                # Empty when the stage only ran on other threads
+                self.profiles[name].create_stats()
+                if self.profiles[name].stats:
+                    pstats.Stats(self.profiles[name]).dump_stats(os.path.join(run_dir, f"{name}.pstats"))
+
+            top = sorted(stats.allocations.items(), key=lambda item: item[1][0], reverse=True)[:self.top]
+            with open(os.path.join(run_dir, f"{name}.alloc.txt"), "w", encoding="utf-8") as f:
+                f.write(f"# {name}: memory allocated and still held at the end of the first "
+                        f"{min(stats.snapshots, self.max_snapshots)} of {stats.activations} activations\n")
+                for line, (size, count) in top:
+                    f.write(f"{size / 1024:12.1f} KiB {count:9d} blocks  {line}\n")
+
+            summary[name] = {
+                "activations": stats.activations,
+                "seconds": round(stats.seconds, 3),
+                "cpu_seconds": round(stats.cpu_seconds, 3),
+                "traced_peak_kb": None if stats.traced_peak is None else stats.traced_peak // 1024,
+                "rss_peak_kb": stats.rss_peak_kb,
+                "rss_growth_kb": stats.rss_growth_kb if stats.rss_peak_kb is not None else None,
+            }
+        summary["run"] = {
+            "seconds": round(self._seconds[0], 3),
+            "cpu_seconds": round(self._seconds[1], 3),
+            "snapshot_seconds": round(self.overhead, 3),
+            "rss_peak_kb": _peak_rss_kb(),
+        }
+
+        with open(os.path.join(run_dir, "summary.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+        for name, row in summary.items():
+            if name == "run":
+                logger.info(f"profile run: {row['seconds']}s wall, {row['cpu_seconds']}s cpu, "
+                            f"{row['snapshot_seconds']}s in snapshots, peak RSS {row['rss_peak_kb']} KiB")
+            else:
+                logger.info(f"profile {name}: {row['activations']} runs, {row['seconds']}s wall, "
+                            f"{row['cpu_seconds']}s cpu, traced peak {row['traced_peak_kb']} KiB, "
+                            f"peak RSS {row['rss_peak_kb']} KiB (+{row['rss_growth_kb']})")
+        return run_dir
+
+
+_active: Optional[StageProfiler] = None
+_overhead = 0.0   # seconds all runs so far have spent taking snapshots, see clock()
+
+
+def _add_overhead(seconds: float):
+    global _overhead
+    _overhead += seconds
+
+
+@contextmanager
+def profile_run(out_dir: Optional[str] = PROFILE_DIR, **options) -> Iterator[Optional[StageProfiler]]:
+    """
+    Profile every stage entered inside the block and write the reports to out_dir when it ends.
+    A no-op when out_dir is empty or a run is already being profiled.
+    """
+    global _active
+    if not out_dir or _active is not None:
+        yield _active
+        return
+
+    profiler = StageProfiler(out_dir, **options)
+    was_tracing = tracemalloc.is_tracing()
+    profiler.start()
+    _active = profiler
+    try:
+        yield profiler
+    finally:
+        _active = None
+        profiler.stop()
+        run_dir = profiler.write_reports()
+        if not was_tracing:
+            tracemalloc.stop()
+        logger.info(f"Profiles written to {run_dir}")
+
+
+def clock() -> float:
+    """
+    time.perf_counter() less the time profiling has spent taking snapshots, for budgets
+    (like the sources' deadlines) that profiling shouldn't eat into
+    """
+    return time.perf_counter() - _overhead
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Profile the block as part of stage name, if a run is being profiled
+    """
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    with profiler.stage(name):
+        yield
+
+
+def iterate(name: str, items: Iterable[T]) -> Iterator[T]:
+    """
+    Iterate items with each next() profiled as stage name, e.g. pages pulled from a source
+    """
+    if _active is None:
+        return iter(items)
+    return _profiled(name, iter(items))
+
+
+def _profiled(name: str, iterator: Iterator[T]) -> Iterator[T]:
+    while True:
+        with stage(name):
+            item = next(iterator, _DONE)
+        if item is _DONE:
+            return
+        yield item
+
+
+_DONE = object()